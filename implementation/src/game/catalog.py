@@ -41,8 +41,11 @@ FUEL_ELEMENTS = [
 ]
 
 
+_FUEL_INDEX_RE = re.compile(r"Fuel(\d+)")
+
+
 def _fuel_index(name: str) -> Optional[int]:
-    match = re.match(r"Fuel(\d+)", name)
+    match = _FUEL_INDEX_RE.match(name)
     if not match:
         return None
     try:
@@ -445,9 +448,14 @@ def _component_texts_from_json() -> Dict[str, Dict[str, str]]:
     return texts
 
 
+# Word boundaries in CamelCase sprite names: lower->Upper and letter->digit
+_CAMEL_BREAK_RE = re.compile(r"([a-z])([A-Z])")
+_DIGIT_BREAK_RE = re.compile(r"([A-Za-z])(\d)")
+
+
 def _pretty_component_name(name: str) -> str:
-    name = re.sub(r"([a-z])([A-Z])", r"\1 \2", name)
-    name = re.sub(r"([A-Za-z])(\d)", r"\1 \2", name)
+    name = _CAMEL_BREAK_RE.sub(r"\1 \2", name)
+    name = _DIGIT_BREAK_RE.sub(r"\1 \2", name)
     return name.replace("Generic ", "Generic ").strip()
 
 
@@ -476,6 +484,10 @@ def _component_types_fields() -> List[str]:
     return []
 
 
+# Fuel field variant -> sprite core-count suffix
+_FUEL_VARIANT_SIZE = {"single": "1", "double": "2", "quad": "4"}
+
+
 def _map_component_field(field: str) -> Optional[str]:
     base = field
     variant = "single"
@@ -488,7 +500,7 @@ def _map_component_field(field: str) -> Optional[str]:
 
     if base in FUEL_ELEMENTS:
         idx = FUEL_ELEMENTS.index(base) + 1
-        size = {"single": "1", "double": "2", "quad": "4"}[variant]
+        size = _FUEL_VARIANT_SIZE[variant]
         return f"Fuel{idx}-{size}"
 
     for prefix, tier in TIER_PREFIXES.items():
@@ -532,8 +544,11 @@ def _component_names_from_metadata() -> List[str]:
     return ordered
 
 
+_FUEL_LAYOUT_RE = re.compile(r"Fuel(\d+)-(\d+)$")
+
+
 def _parse_fuel_layout(name: str) -> Optional[Tuple[int, int, int]]:
-    match = re.match(r"Fuel(\d+)-(\d+)$", name)
+    match = _FUEL_LAYOUT_RE.match(name)
     if not match:
         return None
     try:
@@ -552,8 +567,11 @@ def _parse_fuel_layout(name: str) -> Optional[Tuple[int, int, int]]:
     return page, row, col
 
 
+_TIERED_NAME_RE = re.compile(r"([A-Za-z]+)(\d+)$")
+
+
 def _parse_tiered_component(name: str) -> Optional[Tuple[str, int]]:
-    match = re.match(r"([A-Za-z]+)(\d+)$", name)
+    match = _TIERED_NAME_RE.match(name)
     if not match:
         return None
     base = match.group(1)
@@ -747,6 +765,23 @@ def _load_component_types() -> List[ComponentTypeStats]:
     return catalog
 
 
+# RE: stringliteral.json — element-specific mechanic descriptions for experimental fuels.
+# The special description is stored at ExperimentalFuelElement+0x10 and appended
+# to the base description at display time.
+_EXPERIMENTAL_DESCS = {
+    7: ("After burning up completely, it releases a special form of "
+        "radiation that permanently increases the power output of "
+        "other protium cells by 1% per depleted cell."),
+    8: ("Its base power output drops by 2% for each other component "
+        "in the 7 x 7 area surrounding it."),
+    9: ("It gradually cycles between producing only heat and "
+        "producing only power."),
+    10: "Each cell produces four pulses per tick instead of the usual one.",
+    11: ("All components aligned vertically or horizontally are "
+         "considered adjacent to it."),
+}
+
+
 def _build_catalog_from_types(
     catalog: List[ComponentTypeStats], labels: Dict[str, str]
 ) -> List[ComponentTypeStats]:
@@ -807,21 +842,6 @@ def _build_catalog_from_types(
                     comp.description = f"Acts as two {element.lower()} " + text_templates["fuel_large_a"]
                 else:
                     comp.description = tier_prefix + text_templates.get("fuel_base", "")
-                # RE: stringliteral.json — element-specific mechanic descriptions for experimental fuels.
-                # The special description is stored at ExperimentalFuelElement+0x10 and appended
-                # to the base description at display time.
-                _EXPERIMENTAL_DESCS = {
-                    7: ("After burning up completely, it releases a special form of "
-                        "radiation that permanently increases the power output of "
-                        "other protium cells by 1% per depleted cell."),
-                    8: ("Its base power output drops by 2% for each other component "
-                        "in the 7 x 7 area surrounding it."),
-                    9: ("It gradually cycles between producing only heat and "
-                        "producing only power."),
-                    10: "Each cell produces four pulses per tick instead of the usual one.",
-                    11: ("All components aligned vertically or horizontally are "
-                         "considered adjacent to it."),
-                }
                 extra = _EXPERIMENTAL_DESCS.get(fuel_idx)
                 if extra:
                     comp.description += " " + extra
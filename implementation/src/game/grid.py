@@ -69,9 +69,10 @@ class Grid:
         return 0 <= x < self.width and 0 <= y < self.height and 0 <= z < self.layers
 
     def get(self, x: int, y: int, z: int = 0) -> Optional[object]:
-        if not self.in_bounds(x, y, z):
+        # Bounds check and index inlined: this sits on the tick and draw paths.
+        if not (0 <= x < self.width and 0 <= y < self.height and 0 <= z < self.layers):
             return None
-        return self.cells[self.index(x, y, z)]
+        return self.cells[(z * self.height + y) * self.width + x]
 
     def set(self, x: int, y: int, z: int, value: Optional[object]) -> None:
         self.cells[self.index(x, y, z)] = value
@@ -79,11 +80,27 @@ class Grid:
     def clear(self, x: int, y: int, z: int = 0) -> None:
         self.set(x, y, z, None)
 
+    def clear_all(self) -> None:
+        """Empty every cell on every layer in one pass."""
+        self.cells[:] = [None] * len(self.cells)
+
     def iter_cells(self) -> Iterable[Tuple[int, int, int, Optional[object]]]:
+        # Walk the backing list directly: cells are stored in (z, y, x) order.
+        cells = iter(self.cells)
         for z in range(self.layers):
             for y in range(self.height):
                 for x in range(self.width):
-                    yield x, y, z, self.get(x, y, z)
+                    yield x, y, z, next(cells)
+
+    def iter_occupied(self) -> Iterable[Tuple[int, int, int, object]]:
+        """Like iter_cells, but skips empty cells without yielding them."""
+        width = self.width
+        plane = width * self.height
+        for idx, value in enumerate(self.cells):
+            if value is not None:
+                z, rem = divmod(idx, plane)
+                y, x = divmod(rem, width)
+                yield x, y, z, value
 
     def neighbor_offsets(self, x: int, y: int) -> list[int]:
         offsets: list[int] = []
@@ -123,6 +140,33 @@ class Grid:
                     coords.append((nx, ny, z))
         return coords
 
+    def occupancy_table(self, z: int = 0) -> list[list[int]]:
+        """Summed-area table of occupied cells on layer z.
+
+        table[y][x] counts occupied cells with column < x and row < y.
+        """
+        table = [[0] * (self.width + 1)]
+        for y in range(self.height):
+            above = table[y]
+            row = [0]
+            run = 0
+            for x in range(self.width):
+                if self.get(x, y, z) is not None:
+                    run += 1
+                row.append(above[x + 1] + run)
+            table.append(row)
+        return table
+
+    def count_occupied(self, table: list[list[int]], x0: int, y0: int, x1: int, y1: int) -> int:
+        """Occupied cells in the inclusive rectangle (x0, y0)-(x1, y1), clipped to the grid."""
+        x0 = max(x0, 0)
+        y0 = max(y0, 0)
+        x1 = min(x1, self.width - 1) + 1
+        y1 = min(y1, self.height - 1) + 1
+        if x0 >= x1 or y0 >= y1:
+            return 0
+        return table[y1][x1] - table[y0][x1] - table[y1][x0] + table[y0][x0]
+
     # ── Scroll / Resize ──────────────────────────────────────────
 
     @property
@@ -9,6 +9,7 @@ Import: supports raw JSON, base64-JSON, and original encrypted format.
 from __future__ import annotations
 
 import base64
+import functools
 import hashlib
 import json
 import math
@@ -17,7 +18,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from game.simulation import Simulation
+    from game.simulation import ReactorComponent, Simulation
 
 _WEB = sys.platform == "emscripten"
 
@@ -84,15 +85,21 @@ def _ms_password_derive_bytes(password: bytes, salt: bytes,
     return bytes(result[:key_len])
 
 
+@functools.lru_cache(maxsize=1)
+def _get_original_key() -> bytes:
+    """Derived AES key for the original save format (inputs are constant)."""
+    return _ms_password_derive_bytes(
+        _PASS_PHRASE, _SALT_VALUE, _PASSWORD_ITERATIONS, _KEY_SIZE // 8
+    )
+
+
 def _decrypt_original(ciphertext: bytes) -> str | None:
     """Decrypt an original Reactor Idle save (AES-256-CBC, PKCS7 padding).
 
     Uses pycryptodome if available, otherwise falls back to a pure-Python
     AES implementation (no external dependencies needed in Pyodide).
     """
-    key = _ms_password_derive_bytes(
-        _PASS_PHRASE, _SALT_VALUE, _PASSWORD_ITERATIONS, _KEY_SIZE // 8
-    )
+    key = _get_original_key()
 
     decrypted = None
 
@@ -134,9 +141,7 @@ def _decrypt_original(ciphertext: bytes) -> str | None:
 
 def _encrypt_original(plaintext: str) -> str | None:
     """Encrypt Reactor Idle plaintext save to base64 (AES-256-CBC, PKCS7)."""
-    key = _ms_password_derive_bytes(
-        _PASS_PHRASE, _SALT_VALUE, _PASSWORD_ITERATIONS, _KEY_SIZE // 8
-    )
+    key = _get_original_key()
     data = plaintext.encode("utf-8")
     pad = 16 - (len(data) % 16)
     padded = data + bytes([pad]) * pad
@@ -392,7 +397,7 @@ def _legacy_grid_height_from_upgrades(upgrade_levels: list[int]) -> int:
 def _build_new_export_text(sim: Simulation) -> str:
     """Build unrestricted base64-JSON export payload."""
     data = _build_save_dict(sim)
-    json_str = json.dumps(data, separators=(",", ":"))
+    json_str = json.dumps(data, separators=(",", ":"), cls=_SaveEncoder)
     return base64.b64encode(json_str.encode("utf-8")).decode("ascii")
 
 
@@ -556,19 +561,38 @@ def _parse_original_save(text: str) -> dict | None:
     }
 
 
+class _SaveCompRow:
+    """Slotted per-component save row; serialized by _SaveEncoder.
+
+    Avoids allocating one dict per placed component on every auto-save.
+    """
+    __slots__ = ("name", "heat", "durability", "depleted", "x", "y", "z")
+
+    def __init__(self, comp: ReactorComponent) -> None:
+        self.name = comp.stats.name
+        self.heat = comp.heat
+        self.durability = comp.durability
+        self.depleted = comp.depleted
+        self.x = comp.grid_x
+        self.y = comp.grid_y
+        self.z = comp.grid_z
+
+
+class _SaveEncoder(json.JSONEncoder):
+    """JSON encoder that emits _SaveCompRow as a plain object."""
+
+    def default(self, o):
+        if isinstance(o, _SaveCompRow):
+            return {slot: getattr(o, slot) for slot in _SaveCompRow.__slots__}
+        return super().default(o)
+
+
 def _build_save_dict(sim: Simulation) -> dict:
-    """Build a JSON-serializable dict from simulation state."""
-    components = []
-    for comp in sim.components:
-        components.append({
-            "name": comp.stats.name,
-            "heat": comp.heat,
-            "durability": comp.durability,
-            "depleted": comp.depleted,
-            "x": comp.grid_x,
-            "y": comp.grid_y,
-            "z": comp.grid_z,
-        })
+    """Build a JSON-serializable dict from simulation state.
+
+    Components are staged as _SaveCompRow; serialize with cls=_SaveEncoder.
+    """
+    components = [_SaveCompRow(comp) for comp in sim.components]
 
     upgrade_levels = [u.level for u in sim.upgrade_manager.upgrades]
 
@@ -625,6 +649,7 @@ def _restore_from_dict(sim: Simulation, data: dict) -> bool:
         for i, level in enumerate(upgrade_levels):
             if i < len(sim.upgrade_manager.upgrades):
                 sim.upgrade_manager.upgrades[i].level = int(level)
+        sim.upgrade_manager.invalidate()
 
         # 2b. Resize grid for Subspace Expansion (upgrade 50) before placing components
         sim.resize_grid_for_subspace()
@@ -642,9 +667,7 @@ def _restore_from_dict(sim: Simulation, data: dict) -> bool:
 
         # 4. Clear existing grid/components, reconstruct from saved components
         if sim.grid is not None:
-            for x, y, z, comp in list(sim.grid.iter_cells()):
-                if comp is not None:
-                    sim.grid.set(x, y, z, None)
+            sim.grid.clear_all()
         sim.components.clear()
 
         # Build name -> stats lookup from shop catalog
@@ -673,8 +696,9 @@ def _restore_from_dict(sim: Simulation, data: dict) -> bool:
             else:
                 print(f"[save] Warning: component '{name}' at ({rc.grid_x},{rc.grid_y}) out of bounds, skipping")
 
-        # 5. Mark pulses dirty and recompute capacities
+        # 5. Mark pulses/type counts dirty and recompute capacities
         sim._pulses_dirty = True
+        sim._type_counts_dirty = True
         sim.recompute_max_capacities()
 
         # 6. Sync store with reactor state
@@ -695,13 +719,16 @@ def _try_import_data(encoded: str) -> dict | None:
     2. base64 -> JSON dict (new export format)
     3. base64 -> AES-256-CBC ciphertext -> pipe-delimited (original game)
     """
-    # 1. Try raw JSON first (desktop save.json / direct paste)
-    try:
-        data = json.loads(encoded)
-        if isinstance(data, dict) and "version" in data:
-            return data
-    except (json.JSONDecodeError, ValueError):
-        pass
+    # 1. Try raw JSON first (desktop save.json / direct paste).
+    # "{" is not in the base64 alphabet, so this never shadows formats 2/3.
+    if encoded[:1] == "{":
+        try:
+            data = json.loads(encoded)
+            if isinstance(data, dict) and "version" in data:
+                return data
+        except (json.JSONDecodeError, ValueError):
+            pass
+        return None
 
     # 2. Try base64 -> JSON (new export format)
     try:
@@ -709,12 +736,16 @@ def _try_import_data(encoded: str) -> dict | None:
     except Exception:
         return None
 
-    try:
-        data = json.loads(raw.decode("utf-8"))
-        if isinstance(data, dict) and "version" in data:
-            return data
-    except (json.JSONDecodeError, UnicodeDecodeError):
-        pass
+    # Sniff the first decoded byte: JSON exports start with "{", ciphertext is
+    # random, so only attempt the JSON parse when it can plausibly succeed.
+    # A failed parse still falls through, since ciphertext may begin with 0x7B.
+    if raw[:1] == b"{":
+        try:
+            data = json.loads(raw.decode("utf-8"))
+            if isinstance(data, dict) and "version" in data:
+                return data
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            pass
 
     # 3. Try original game format: base64 -> AES ciphertext -> pipe-delimited
     if len(raw) % 16 == 0 and len(raw) >= 16:
@@ -791,7 +822,7 @@ if _WEB:
     def save_game(sim: Simulation, path=None) -> None:
         """Auto-save to localStorage."""
         data = _build_save_dict(sim)
-        json_str = json.dumps(data, separators=(",", ":"))
+        json_str = json.dumps(data, separators=(",", ":"), cls=_SaveEncoder)
         if _bridge_set_save_text(json_str):
             return
         try:
@@ -889,7 +920,7 @@ else:
         data = _build_save_dict(sim)
         tmp_path = path.with_suffix(".tmp")
         try:
-            tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            tmp_path.write_text(json.dumps(data, indent=2, cls=_SaveEncoder), encoding="utf-8")
             tmp_path.replace(path)
         except OSError as e:
             print(f"[save] Error saving game: {e}")
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+import functools
 import math
 from dataclasses import dataclass, field
-import re
 from typing import List, Optional, Tuple
 
 from game.grid import Grid
@@ -12,15 +12,39 @@ from game.upgrades import UpgradeManager, StatCategory
 
 
 def _fuel_index(name: str) -> Optional[int]:
-    match = re.match(r"Fuel(\d+)", name)
-    if not match:
+    if not name.startswith("Fuel"):
         return None
-    try:
-        return int(match.group(1))
-    except ValueError:
+    # Leading decimal run after the prefix (same as re.match(r"Fuel(\d+)")).
+    end = 4
+    while end < len(name) and name[end].isdecimal():
+        end += 1
+    if end == 4:
         return None
-
-
+    return int(name[4:end])
+
+
+# StatCategory values as plain ints. Enum member access and IntEnum-keyed
+# dict lookups cost several times more than ints on the per-component paths.
+_STAT_MAX_DURABILITY = int(StatCategory.MAX_DURABILITY)
+_STAT_HEAT_CAPACITY = int(StatCategory.HEAT_CAPACITY)
+_STAT_ENERGY_PER_PULSE = int(StatCategory.ENERGY_PER_PULSE)
+_STAT_HEAT_PER_PULSE = int(StatCategory.HEAT_PER_PULSE)
+_STAT_SELF_VENT_RATE = int(StatCategory.SELF_VENT_RATE)
+_STAT_ADJACENT_TRANSFER_RATE = int(StatCategory.ADJACENT_TRANSFER_RATE)
+_STAT_REACTOR_TRANSFER_RATE = int(StatCategory.REACTOR_TRANSFER_RATE)
+_STAT_REACTOR_HEAT_CAP_INCREASE = int(StatCategory.REACTOR_HEAT_CAP_INCREASE)
+_STAT_REACTOR_POWER_CAP_INCREASE = int(StatCategory.REACTOR_POWER_CAP_INCREASE)
+_STAT_AUTO_SELL_RATE = int(StatCategory.AUTO_SELL_RATE)
+_STAT_AUTO_VENT_RATE = int(StatCategory.AUTO_VENT_RATE)
+_STAT_CELL_EFFECTIVENESS = int(StatCategory.CELL_EFFECTIVENESS)
+_STAT_REFLECTOR_EFFECTIVENESS = int(StatCategory.REFLECTOR_EFFECTIVENESS)
+
+# component_type_id values assigned by catalog._compute_component_type_id
+# (fuels 2-7 and 16-20, other categories 8-15, 0 when unknown).
+_STAT_LUT_SIZE = 21
+
+
+@functools.lru_cache(maxsize=None)
 def _component_shop_page(name: str) -> int:
     if name.startswith("Fuel"):
         fuel = _fuel_index(name)
@@ -49,7 +73,7 @@ def _component_shop_page(name: str) -> int:
     return 3
 
 
-@dataclass
+@dataclass(slots=True)
 class ReactorComponent:
     stats: ComponentTypeStats
     heat: float = 0.0
@@ -61,13 +85,16 @@ class ReactorComponent:
     grid_y: int = 0
     grid_z: int = 0
     pulse_count: int = 0  # pulses received from neighbors (recalculated on layout change)
+    # Upgrade-scaled heat capacity / max durability (refreshed with the rate cache)
+    eff_heat_cap: float = 0.0
+    eff_max_durability: float = 0.0
 
     def __post_init__(self):
         if self.durability == 0.0 and self.stats.max_durability > 0:
             self.durability = self.stats.max_durability
 
 
-@dataclass
+@dataclass(slots=True)
 class ExplosionEffect:
     """Visual explosion animation spawned when a component is destroyed.
 
@@ -82,7 +109,7 @@ class ExplosionEffect:
     fps: float = 16.0  # 12 frames at 16fps ≈ 0.75s
 
 
-@dataclass
+@dataclass(slots=True)
 class Simulation:
     """Reactor simulation matching the decoded WASM tick pipeline.
 
@@ -107,6 +134,11 @@ class Simulation:
     shop_page: int = 0
     prestige_level: int = 0
     upgrade_manager: UpgradeManager = field(default_factory=UpgradeManager)
+    # shop_components_for_page results per page, valid for one upgrade
+    # version and one shop_components list.
+    _shop_page_cache: dict[int, List[ComponentTypeStats]] = field(default_factory=dict, repr=False)
+    _shop_page_version: int = field(default=-1, repr=False)
+    _shop_page_source: Optional[List[ComponentTypeStats]] = field(default=None, repr=False)
 
     # View state: "reactor", "upgrades", "prestige", "options", "statistics", "help"
     view_mode: str = "reactor"
@@ -124,8 +156,11 @@ class Simulation:
     # Heat: GetStatCached(1, 0xb) * 1000.0 + sum(component contributions)
     # Power: GetStatCached(1, 0xc) * 100.0 + sum(component contributions)
     # With no upgrades: GetStatCached returns 1.0
-    max_reactor_heat: float = 1000.0   # Reactor.cachedMaxHeat (+0x48) = 1.0 * 1000.0
-    max_reactor_power: float = 100.0   # Reactor.cachedMaxPower (+0x58) = 1.0 * 100.0
+    # Stored privately; read through the max_reactor_heat/max_reactor_power
+    # properties, which apply any recompute deferred by place/remove.
+    _max_reactor_heat: float = 1000.0   # Reactor.cachedMaxHeat (+0x48) = 1.0 * 1000.0
+    _max_reactor_power: float = 100.0   # Reactor.cachedMaxPower (+0x58) = 1.0 * 100.0
+    _caps_dirty: bool = False
 
     # Manual vent/sell amounts (RE: GetStatCached(1, 14) / GetStatCached(1, 13))
     # With no upgrades, GetStatCached returns 1.0
@@ -152,6 +187,66 @@ class Simulation:
     # Dirty flag for pulse recalculation
     _pulses_dirty: bool = True
 
+    # Live (non-depleted) component totals for count_components_of_type and
+    # sum_component_tiers. _type_totals maps (type_of_component, name) to
+    # [count, tier_sum]; _prefix_totals memoizes (count, tier_sum) per queried
+    # prefix. Both are rebuilt when _type_counts_dirty is set, which every
+    # placement, removal, destruction and depletion does.
+    _type_counts_dirty: bool = field(default=True, repr=False)
+    _type_totals: dict[Tuple[str, str], List[int]] = field(default_factory=dict, repr=False)
+    _prefix_totals: dict[str, Tuple[int, int]] = field(default_factory=dict, repr=False)
+
+    # Layout cache, rebuilt whenever _pulses_dirty is consumed (layout changes
+    # always set it). Cells are (x, y, z, comp, nbrs) in grid scan order, where
+    # nbrs holds the occupied cardinal neighbors in grid.neighbors order; the
+    # role lists below hold components in self.components order.
+    _live_cells: List[Tuple[int, int, int, ReactorComponent, Tuple[ReactorComponent, ...]]] = field(
+        default_factory=list, repr=False)
+    # Fuel cells also carry the neighbors that absorb heat and, for Monastium,
+    # the occupied-cell count of the surrounding 7×7 window (0 otherwise).
+    _fuel_cells: List[Tuple[int, int, int, ReactorComponent, Tuple[ReactorComponent, ...],
+                            Tuple[ReactorComponent, ...], int]] = field(default_factory=list, repr=False)
+    _exchanger_cells: List[Tuple[int, int, int, ReactorComponent, Tuple[ReactorComponent, ...]]] = field(
+        default_factory=list, repr=False)
+    _vent_comps: List[ReactorComponent] = field(default_factory=list, repr=False)
+    _hull_comps: List[Tuple[ReactorComponent, Tuple[ReactorComponent, ...]]] = field(
+        default_factory=list, repr=False)
+    # (coolant, absorbable cells within Manhattan radius 2)
+    _extreme_coolants: List[Tuple[ReactorComponent, Tuple[ReactorComponent, ...]]] = field(
+        default_factory=list, repr=False)
+    _extreme_capacitors: List[ReactorComponent] = field(default_factory=list, repr=False)
+
+    # Upgrade-scaled rates and capacities for the cached roles, rebuilt when
+    # upgrade_manager.version changes or the layout cache is rebuilt.
+    # Global per-tick multipliers (self_vent_mult, heat_exchange_mult) are
+    # applied at use time.
+    _rates_version: int = field(default=-1, repr=False)
+    _vent_rates: List[Tuple[ReactorComponent, float]] = field(default_factory=list, repr=False)
+    # (comp, is_outlet, targets, rate): inlet targets are neighbors that can
+    # lose heat, outlet targets are neighbors that absorb heat
+    _hull_rates: List[Tuple[ReactorComponent, bool, Tuple[ReactorComponent, ...], float]] = field(
+        default_factory=list, repr=False)
+    _outlet_rates: List[Tuple[ReactorComponent, bool, Tuple[ReactorComponent, ...], float]] = field(
+        default_factory=list, repr=False)
+    # (exchanger, rate, capacity, ((partner, partner capacity), ...))
+    _exchanger_rates: List[Tuple[ReactorComponent, float, float,
+                                 Tuple[Tuple[ReactorComponent, float], ...]]] = field(
+        default_factory=list, repr=False)
+
+    # Last (value, total EP) from calculate_prestige_ep; the UI asks every frame
+    _prestige_ep_memo: Tuple[float, int] = field(default=(-1.0, 0), repr=False)
+    # (highwater EP, value below which no new EP can be earned)
+    _prestige_ep_threshold: Tuple[int, float] = field(default=(-1, 0.0), repr=False)
+
+    # Upgrade multipliers per stat category, indexed by component_type_id.
+    # Filled lazily by _stat_lut and dropped when upgrade_manager.version moves.
+    _stat_luts: dict[int, List[float]] = field(default_factory=dict, repr=False)
+    _stat_luts_version: int = field(default=-1, repr=False)
+
+    # Kymium cosine table for one upgraded max durability, filled on demand
+    _kymium_lut_max: float = field(default=0.0, repr=False)
+    _kymium_lut: List[Optional[float]] = field(default_factory=list, repr=False)
+
     # Tick timing — from unnamed_function_10418 (Simulation.LogicalUpdate):
     #   while (Time.time - lastTick > 1.0 / ticksPerSecond):
     #       executeTick(); lastTick += 1.0 / ticksPerSecond
@@ -169,14 +264,48 @@ class Simulation:
     prestige_confirming: bool = False   # Phase B: awaiting second click
     prestige_can_refund: bool = False   # Phase C: post-prestige refund window
 
+    @property
+    def max_reactor_heat(self) -> float:
+        if self._caps_dirty:
+            self.recompute_max_capacities()
+        return self._max_reactor_heat
+
+    @max_reactor_heat.setter
+    def max_reactor_heat(self, value: float) -> None:
+        self._max_reactor_heat = value
+
+    @property
+    def max_reactor_power(self) -> float:
+        if self._caps_dirty:
+            self.recompute_max_capacities()
+        return self._max_reactor_power
+
+    @max_reactor_power.setter
+    def max_reactor_power(self, value: float) -> None:
+        self._max_reactor_power = value
+
     def _stat_mult(self, type_id: int, stat: int) -> float:
         """Return upgrade multiplier for a (component_type_id, stat_category) pair.
 
         RE: effective_stat = base_stat * GetUpgradeStatBonus(type_id, stat).
         With no upgrades purchased, returns 1.0 (identity).
         """
+        if 0 <= type_id < _STAT_LUT_SIZE:
+            return self._stat_lut(stat)[type_id]
         return self.upgrade_manager.get_upgrade_stat_bonus(type_id, stat)
 
+    def _stat_lut(self, stat: int) -> List[float]:
+        """Return the multipliers for one stat category, indexed by component_type_id."""
+        version = self.upgrade_manager.version
+        if self._stat_luts_version != version:
+            self._stat_luts.clear()
+            self._stat_luts_version = version
+        lut = self._stat_luts.get(stat)
+        if lut is None:
+            bonus = self.upgrade_manager.get_upgrade_stat_bonus
+            lut = self._stat_luts[stat] = [bonus(tid, stat) for tid in range(_STAT_LUT_SIZE)]
+        return lut
+
     def step(self, dt: float) -> None:
         """Accumulate time and fire ticks at the correct rate."""
         self._tick_accumulator += dt
@@ -191,9 +320,10 @@ class Simulation:
         self.last_heat_change = 0.0
         self.last_power_change = 0.0
         self.total_ticks += 1
-
-        # Note: NO early return for empty components — auto-vent must always run
-        # (the binary's tick pipeline always executes fn 10428/10429 regardless)
+        # Settle capacities deferred by place/remove against the multipliers
+        # they were placed under, before PrepareMultipliers refreshes them.
+        if self._caps_dirty:
+            self.recompute_max_capacities()
 
         # Step 1: PrepareMultipliers
         self.upgrade_manager.prepare_multipliers(self)
@@ -203,8 +333,17 @@ class Simulation:
 
         # Step 2: DistributePulses (recalc when layout changes)
         if self._pulses_dirty:
+            self._rebuild_layout_cache()
             self._distribute_pulses()
             self._pulses_dirty = False
+        if self._rates_version != self.upgrade_manager.version:
+            self._rebuild_rate_cache()
+
+        # Empty reactor: steps 3-9 cannot move heat or power, but auto-vent and
+        # auto-sell must still run (the binary always executes fn 10428/10429).
+        if not self.components:
+            self._auto_vent_and_sell(0.0)
+            return
 
         # Step 3: DrainDurability
         self._drain_durability()
@@ -236,6 +375,10 @@ class Simulation:
         # Step 9: Check explosions (RE: fn 10429 — explosions BEFORE auto-vent)
         self._check_explosions()
 
+        self._auto_vent_and_sell(net_heat_accumulator)
+
+    def _auto_vent_and_sell(self, net_heat_accumulator: float) -> None:
+        """Tick tail: auto-vent, auto-sell, final clamps and store sync."""
         # Step 10: AutoVent (RE: fn 10429 lines 390126-390190)
         # Auto-vent rate = maxHeat * autoVentMult * 0.01 + maxHeat * 0.0001
         # Enhanced decay when overheating AND net heat accumulator <= 0:
@@ -265,16 +408,14 @@ class Simulation:
             # Formula: autoSellMult * GetStatCached(type, 12) * 0.005 * (sold / autoSellRate)
             # Heat goes to the component, clamped to its heat capacity.
             auto_sell_mult = self.upgrade_manager.get_upgrade_stat_bonus(
-                1, StatCategory.AUTO_SELL_RATE) - 1.0
+                1, _STAT_AUTO_SELL_RATE) - 1.0
             if auto_sell_mult > 0:
                 sell_ratio = sold / auto_sell if auto_sell > 0 else 0.0
-                for comp in self.components:
-                    if (comp.stats.type_of_component == "Capacitor"
-                            and comp.stats.name == "Capacitor6"
-                            and not comp.depleted):
+                for comp in self._extreme_capacitors:
+                    if not comp.depleted:
                         # stat 12 = ReactorPowerCapacityIncrease with upgrade bonus
                         power_cap_inc = comp.stats.reactor_power_capacity_increase * self._stat_mult(
-                            comp.stats.component_type_id, StatCategory.REACTOR_POWER_CAP_INCREASE)
+                            comp.stats.component_type_id, _STAT_REACTOR_POWER_CAP_INCREASE)
                         heat_added = auto_sell_mult * power_cap_inc * 0.005 * sell_ratio
                         comp.heat += heat_added
                         # Clamp to component's effective heat capacity
@@ -290,6 +431,119 @@ class Simulation:
         self.store.power = self.stored_power
         self.store.heat = self.reactor_heat
 
+    def _rebuild_layout_cache(self) -> None:
+        """Snapshot occupied cells and per-role component lists for the tick.
+
+        Tick phases iterate these instead of scanning empty tiles and
+        re-testing type strings every tick, and walk precomputed neighbor
+        tuples instead of calling grid.neighbors/grid.get per cell. Depletion
+        is still checked per tick since it does not change occupancy.
+        """
+        self._live_cells = []
+        self._fuel_cells = []
+        self._exchanger_cells = []
+        self._vent_comps = []
+        self._hull_comps = []
+        self._extreme_coolants = []
+        self._extreme_capacitors = []
+        self._rates_version = -1
+        grid = self.grid
+        if grid is None:
+            return
+
+        def occupied(coords: List[Tuple[int, int, int]]) -> Tuple[ReactorComponent, ...]:
+            return tuple(c for c in (grid.get(nx, ny, nz) for nx, ny, nz in coords) if c is not None)
+
+        for comp in self.components:
+            stats = comp.stats
+            kind = stats.type_of_component
+            # RE: only Vents have binary SelfVentRate > 0; see _vent_heat_to_air.
+            if stats.self_vent_rate > 0 and kind not in ("Exchanger", "Inlet", "Outlet"):
+                self._vent_comps.append(comp)
+            if stats.reactor_vent_rate > 0 and kind in ("Inlet", "Outlet"):
+                self._hull_comps.append((comp, occupied(grid.neighbors(comp.grid_x, comp.grid_y, 0))))
+            if kind == "Coolant" and stats.name == "Coolant6":
+                # Heat-capacity and CantLoseHeat flags are static, so filter the ring here
+                ring = tuple(
+                    n for n in occupied(grid.manhattan_neighbors(comp.grid_x, comp.grid_y, 0, radius=2))
+                    if n.stats.heat_capacity > 0 and not n.stats.cant_lose_heat
+                )
+                self._extreme_coolants.append((comp, ring))
+            if kind == "Capacitor" and stats.name == "Capacitor6":
+                self._extreme_capacitors.append(comp)
+        occupancy: dict[int, list[list[int]]] = {}
+        for x, y, z, comp in grid.iter_occupied():
+            nbrs = occupied(grid.neighbors(x, y, z))
+            cell = (x, y, z, comp, nbrs)
+            self._live_cells.append(cell)
+            if comp.stats.pulses_produced > 0 or comp.stats.energy_per_pulse > 0:
+                absorbers = tuple(n for n in nbrs if n.stats.heat_capacity > 0)
+                density = 0
+                if comp.stats.component_type_id == 17:
+                    table = occupancy.get(z)
+                    if table is None:
+                        table = occupancy[z] = grid.occupancy_table(z)
+                    density = grid.count_occupied(table, x - 3, y - 3, x + 3, y + 3)
+                self._fuel_cells.append(cell + (absorbers, density))
+            if comp.stats.type_of_component == "Exchanger":
+                self._exchanger_cells.append(cell)
+
+    def _rebuild_rate_cache(self) -> None:
+        """Precompute upgrade-scaled rates/capacities for the cached roles.
+
+        Only per-tick state (heat, depletion, global multipliers) is left for
+        the phases; static skips (zero rate or capacity, CantLoseHeat
+        partners) are filtered out here.
+        """
+        self._refresh_effective_stats()
+        stat_mult = self._stat_mult
+        self._vent_rates = [
+            (comp, comp.stats.self_vent_rate * stat_mult(comp.stats.component_type_id, _STAT_SELF_VENT_RATE))
+            for comp in self._vent_comps
+        ]
+        self._hull_rates = []
+        for comp, nbrs in self._hull_comps:
+            rate = comp.stats.reactor_vent_rate * stat_mult(
+                comp.stats.component_type_id, _STAT_REACTOR_TRANSFER_RATE)
+            if comp.stats.type_of_component == "Outlet":
+                # 0xC9 HeatAbsorb flag
+                targets = tuple(n for n in nbrs if n.stats.heat_capacity > 0)
+                self._hull_rates.append((comp, True, targets, rate))
+            else:
+                # Skip CantLoseHeat flag (0xCA): Reflectors + ExtremeCoolant
+                targets = tuple(n for n in nbrs if not n.stats.cant_lose_heat)
+                self._hull_rates.append((comp, False, targets, rate))
+        self._outlet_rates = [entry for entry in self._hull_rates if entry[1]]
+        self._exchanger_rates = []
+        for _x, _y, _z, comp, nbrs in self._exchanger_cells:
+            base_rate = comp.stats.self_vent_rate
+            if base_rate <= 0:
+                continue
+            comp_cap = comp.eff_heat_cap
+            if comp_cap <= 0:
+                continue
+            rate = base_rate * stat_mult(comp.stats.component_type_id, _STAT_ADJACENT_TRANSFER_RATE)
+            partners = []
+            for ncomp in nbrs:
+                # Skip CantLoseHeat components (0xCA=1): Reflectors + ExtremeCoolant
+                if ncomp.stats.cant_lose_heat:
+                    continue
+                ncap = ncomp.eff_heat_cap
+                if ncap > 0:
+                    partners.append((ncomp, ncap))
+            self._exchanger_rates.append((comp, rate, comp_cap, tuple(partners)))
+        self._rates_version = self.upgrade_manager.version
+
+    def _refresh_effective_stats(self) -> None:
+        """Recompute each component's upgrade-scaled heat capacity and max durability."""
+        cap_mults = self._stat_lut(_STAT_HEAT_CAPACITY)
+        dur_mults = self._stat_lut(_STAT_MAX_DURABILITY)
+        for comp in self.components:
+            stats = comp.stats
+            tid = stats.component_type_id
+            comp.eff_heat_cap = stats.heat_capacity * cap_mults[tid]
+            comp.eff_max_durability = stats.max_durability * dur_mults[tid]
+
     def _distribute_pulses(self) -> None:
         """RE: unnamed_function_10441 — distribute pulses to self and cardinal neighbors.
 
@@ -308,51 +562,57 @@ class Simulation:
         for comp in self.components:
             comp.pulse_count = 0
 
-        for x, y, z, comp in self.grid.iter_cells():
-            if comp is None or comp.depleted:
+        for x, y, z, comp, nbrs, _absorbers, _density in self._fuel_cells:
+            if comp.depleted:
                 continue
             if comp.stats.pulses_produced <= 0:
                 continue  # not a fuel cell
 
             pulses = int(comp.stats.pulses_produced)
             cores = comp.stats.number_of_cores
-            # Scale factor: floor(log2(cores) + 1) — for single-core cells this is 1
-            scale = int(math.log2(cores) + 1) if cores >= 1 else 1
+            # Scale factor: floor(log2(cores) + 1), i.e. the bit length of the
+            # integer core count (1, 2, 2, 3 for 1-4 cores)
+            scale = cores.bit_length() if cores >= 1 else 1
 
             # Add to self (line 391434)
             comp.pulse_count += scale * pulses
 
             # RE: fn 10441 — Stavrium (type 0x14/20) distributes to entire row+column
             if comp.stats.component_type_id == 20:
+                # Index the flat cell list directly (row/column are always in bounds)
+                width = self.grid.width
+                height = self.grid.height
+                cells = self.grid.cells
+                row_start = (z * height + y) * width
                 # Entire row (same y, all x except self)
-                for col in range(self.grid.width):
+                for col in range(width):
                     if col != x:
-                        ncomp = self.grid.get(col, y, z)
+                        ncomp = cells[row_start + col]
                         if ncomp is not None:
                             ncomp.pulse_count += pulses
                 # Entire column (same x, all y except self)
-                for row in range(self.grid.height):
+                col_start = z * height * width + x
+                for row in range(height):
                     if row != y:
-                        ncomp = self.grid.get(x, row, z)
+                        ncomp = cells[col_start + row * width]
                         if ncomp is not None:
                             ncomp.pulse_count += pulses
             else:
                 # Standard: distribute to cardinal neighbors (line 391459-391472)
-                for nx, ny, nz in self.grid.neighbors(x, y, z):
-                    ncomp = self.grid.get(nx, ny, nz)
-                    if ncomp is not None:
-                        ncomp.pulse_count += pulses
+                for ncomp in nbrs:
+                    ncomp.pulse_count += pulses
 
     def _drain_durability(self) -> None:
         """Fuel cells lose 1 durability/tick. Reflectors lose neighbor pulse sum."""
         if self.grid is None:
             return
-        for x, y, z, comp in self.grid.iter_cells():
-            if comp is None or comp.depleted:
+        for _x, _y, _z, comp, nbrs in self._live_cells:
+            if comp.depleted:
                 continue
+            stats = comp.stats
 
             # Fuel cells: lose 1 durability per tick
-            if comp.stats.pulses_produced > 0 and comp.stats.max_durability > 0:
+            if stats.pulses_produced > 0 and stats.max_durability > 0:
                 comp.durability -= 1.0
                 if comp.durability <= 0:
                     # RE: Protium (type 0x10/16) — increment permanent depletion counter
@@ -360,23 +620,42 @@ class Simulation:
                         self.depleted_protium_count += 1
                     # Perpetual upgrade + replace toggle: auto-replace depleted fuel cell
                     if self.replace_mode and self.upgrade_manager.has_replaces_self(comp.stats.component_type_id):
-                        dur_mult = self._stat_mult(comp.stats.component_type_id, StatCategory.MAX_DURABILITY)
-                        comp.durability = comp.stats.max_durability * dur_mult
+                        comp.durability = comp.eff_max_durability
                         comp.heat = 0.0
                     else:
                         comp.depleted = True
                     self._pulses_dirty = True
+                    self._type_counts_dirty = True
 
             # Reflectors: lose durability = sum of neighbor PulsesProduced
-            if comp.stats.reflects_pulses > 0 and comp.stats.max_durability > 0:
+            if stats.reflects_pulses > 0 and stats.max_durability > 0:
                 neighbor_pulse_sum = 0
-                for nx, ny, nz in self.grid.neighbors(x, y, z):
-                    ncomp = self.grid.get(nx, ny, nz)
-                    if ncomp is not None and not ncomp.depleted:
+                for ncomp in nbrs:
+                    if not ncomp.depleted:
                         neighbor_pulse_sum += int(ncomp.stats.pulses_produced)
                 comp.durability -= neighbor_pulse_sum
                 if comp.durability <= 0:
                     comp.depleted = True
+                    self._type_counts_dirty = True
+
+    def _kymium_cos(self, durability: float, max_dur: float) -> float:
+        """cos((durability / max_dur) * 8π) — the Kymium pulsation phase.
+
+        Durability drains by exactly 1 per tick, so whole-number values are
+        looked up in a table shared by every Kymium with the same upgraded
+        max durability; anything else falls back to math.cos.
+        """
+        if not (0.0 <= durability <= max_dur) or durability != int(durability):
+            return math.cos((durability / max_dur) * 8.0 * math.pi)
+        if self._kymium_lut_max != max_dur:
+            self._kymium_lut_max = max_dur
+            self._kymium_lut = [None] * (int(max_dur) + 1)
+        k = int(durability)
+        cos_val = self._kymium_lut[k]
+        if cos_val is None:
+            cos_val = math.cos((k / max_dur) * 8.0 * math.pi)
+            self._kymium_lut[k] = cos_val
+        return cos_val
 
     def _generate_power_and_heat(self) -> Tuple[float, float]:
         """RE: unnamed_function_10443 — generate power and heat from fuel cells.
@@ -401,63 +680,55 @@ class Simulation:
         # With no CellEffectiveness upgrades (bonus=1.0), mult is always 1.0.
         overheat_mult = 1.0
         if self.reactor_heat > 1000.0:
-            cell_eff = self.upgrade_manager.get_upgrade_stat_bonus(1, StatCategory.CELL_EFFECTIVENESS)
+            cell_eff = self.upgrade_manager.get_upgrade_stat_bonus(1, _STAT_CELL_EFFECTIVENESS)
             overheat_mult = (math.log(self.reactor_heat) / math.log(1000.0)) * (cell_eff - 1.0) * 0.01 + 1.0
 
-        for x, y, z, comp in self.grid.iter_cells():
-            if comp is None or comp.depleted:
+        # Loop invariants
+        stat_mult = self._stat_mult
+        protium_mult = self.depleted_protium_count / 100.0 + 1.0
+
+        for _x, _y, _z, comp, nbrs, absorbers, occupied in self._fuel_cells:
+            if comp.depleted:
                 continue
-            if comp.stats.energy_per_pulse <= 0:
+            stats = comp.stats
+            if stats.energy_per_pulse <= 0:
                 continue  # not a fuel cell
 
             pulse_count = comp.pulse_count
-            tid = comp.stats.component_type_id
+            tid = stats.component_type_id
 
             # --- Base power (fn 10446) ---
-            epp = comp.stats.energy_per_pulse * self._stat_mult(tid, StatCategory.ENERGY_PER_PULSE)
+            epp = stats.energy_per_pulse * stat_mult(tid, _STAT_ENERGY_PER_PULSE)
             power = float(pulse_count) * epp
 
             # RE: Protium (type 0x10/16) — permanent depletion bonus
             if tid == 16:
-                power *= self.depleted_protium_count / 100.0 + 1.0
+                power *= protium_mult
 
             # --- Base heat (fn 10444) ---
-            hpp = comp.stats.heat_per_pulse * self._stat_mult(tid, StatCategory.HEAT_PER_PULSE)
-            cell_area = comp.stats.cell_width * comp.stats.cell_height
+            hpp = stats.heat_per_pulse * stat_mult(tid, _STAT_HEAT_PER_PULSE)
+            cell_area = stats.cell_width * stats.cell_height
             heat = (float(pulse_count * pulse_count) * hpp) / max(1, cell_area)
 
             # --- Kymium (type 0x12/18) — cosine pulsation ---
             if tid == 18:
-                max_dur = comp.stats.max_durability * self._stat_mult(tid, StatCategory.MAX_DURABILITY)
+                max_dur = stats.max_durability * stat_mult(tid, _STAT_MAX_DURABILITY)
                 if max_dur > 0:
-                    phase = (comp.durability / max_dur) * 8.0 * math.pi
-                    cos_val = math.cos(phase)
+                    cos_val = self._kymium_cos(comp.durability, max_dur)
                     power *= (1.0 - cos_val) / 2.0
                     heat *= (1.0 + cos_val) / 2.0
 
             # --- Monastium (type 0x11/17) — 7×7 density penalty (power only) ---
+            # occupied = filled cells in the 7×7 window (self included), from the layout cache
             if tid == 17:
-                occupied = 0
-                for dy in range(-3, 4):
-                    for dx in range(-3, 4):
-                        nx, ny = x + dx, y + dy
-                        if 0 <= nx < self.grid.width and 0 <= ny < self.grid.height:
-                            if self.grid.get(nx, ny, z) is not None:
-                                occupied += 1
                 power *= 1.0 - occupied * 0.02
 
-            # --- Cardinal neighbor scan: reflector bonus + absorber count ---
+            # --- Cardinal neighbor scan: reflector bonus ---
             reflector_mult = 1.0
-            absorber_count = 0
-            for nx, ny, nz in self.grid.neighbors(x, y, z):
-                ncomp = self.grid.get(nx, ny, nz)
-                if ncomp is None:
-                    continue
+            for ncomp in nbrs:
                 if ncomp.stats.reflects_pulses > 0 and not ncomp.depleted:
-                    ref_bonus = self._stat_mult(ncomp.stats.component_type_id, StatCategory.REFLECTOR_EFFECTIVENESS)
+                    ref_bonus = stat_mult(ncomp.stats.component_type_id, _STAT_REFLECTOR_EFFECTIVENESS)
                     reflector_mult += 0.1 * ref_bonus
-                if ncomp.stats.heat_capacity > 0:
-                    absorber_count += 1
 
             # Apply multipliers to power (reflector, overheat)
             power *= reflector_mult * overheat_mult
@@ -469,14 +740,10 @@ class Simulation:
             total_power += power
 
             # Heat distribution (lines 391810-391851)
-            if absorber_count > 0:
-                heat_per_absorber = heat / absorber_count
-                for nx, ny, nz in self.grid.neighbors(x, y, z):
-                    ncomp = self.grid.get(nx, ny, nz)
-                    if ncomp is None:
-                        continue
-                    if ncomp.stats.heat_capacity > 0:
-                        ncomp.heat += heat_per_absorber
+            if absorbers:
+                heat_per_absorber = heat / len(absorbers)
+                for ncomp in absorbers:
+                    ncomp.heat += heat_per_absorber
             else:
                 total_heat_to_reactor += heat
 
@@ -497,57 +764,48 @@ class Simulation:
         # Mirror overheat multiplier logic from _generate_power_and_heat.
         overheat_mult = 1.0
         if self.reactor_heat > 1000.0:
-            cell_eff = self.upgrade_manager.get_upgrade_stat_bonus(1, StatCategory.CELL_EFFECTIVENESS)
+            cell_eff = self.upgrade_manager.get_upgrade_stat_bonus(1, _STAT_CELL_EFFECTIVENESS)
             overheat_mult = (math.log(self.reactor_heat) / math.log(1000.0)) * (cell_eff - 1.0) * 0.01 + 1.0
 
-        for x, y, z, comp in self.grid.iter_cells():
-            if comp is None or comp.depleted:
+        # Loop invariants
+        stat_mult = self._stat_mult
+        protium_mult = self.depleted_protium_count / 100.0 + 1.0
+
+        for _x, _y, _z, comp, nbrs, absorbers, occupied in self._fuel_cells:
+            if comp.depleted:
                 continue
-            if comp.stats.energy_per_pulse <= 0:
+            stats = comp.stats
+            if stats.energy_per_pulse <= 0:
                 continue
 
             pulse_count = comp.pulse_count
-            tid = comp.stats.component_type_id
+            tid = stats.component_type_id
 
-            epp = comp.stats.energy_per_pulse * self._stat_mult(tid, StatCategory.ENERGY_PER_PULSE)
+            epp = stats.energy_per_pulse * stat_mult(tid, _STAT_ENERGY_PER_PULSE)
             power = float(pulse_count) * epp
 
             if tid == 16:
-                power *= self.depleted_protium_count / 100.0 + 1.0
+                power *= protium_mult
 
-            hpp = comp.stats.heat_per_pulse * self._stat_mult(tid, StatCategory.HEAT_PER_PULSE)
-            cell_area = comp.stats.cell_width * comp.stats.cell_height
+            hpp = stats.heat_per_pulse * stat_mult(tid, _STAT_HEAT_PER_PULSE)
+            cell_area = stats.cell_width * stats.cell_height
             heat = (float(pulse_count * pulse_count) * hpp) / max(1, cell_area)
 
             if tid == 18:
-                max_dur = comp.stats.max_durability * self._stat_mult(tid, StatCategory.MAX_DURABILITY)
+                max_dur = stats.max_durability * stat_mult(tid, _STAT_MAX_DURABILITY)
                 if max_dur > 0:
-                    phase = (comp.durability / max_dur) * 8.0 * math.pi
-                    cos_val = math.cos(phase)
+                    cos_val = self._kymium_cos(comp.durability, max_dur)
                     power *= (1.0 - cos_val) / 2.0
                     heat *= (1.0 + cos_val) / 2.0
 
             if tid == 17:
-                occupied = 0
-                for dy in range(-3, 4):
-                    for dx in range(-3, 4):
-                        nx, ny = x + dx, y + dy
-                        if 0 <= nx < self.grid.width and 0 <= ny < self.grid.height:
-                            if self.grid.get(nx, ny, z) is not None:
-                                occupied += 1
                 power *= 1.0 - occupied * 0.02
 
             reflector_mult = 1.0
-            absorber_count = 0
-            for nx, ny, nz in self.grid.neighbors(x, y, z):
-                ncomp = self.grid.get(nx, ny, nz)
-                if ncomp is None:
-                    continue
+            for ncomp in nbrs:
                 if ncomp.stats.reflects_pulses > 0 and not ncomp.depleted:
-                    ref_bonus = self._stat_mult(ncomp.stats.component_type_id, StatCategory.REFLECTOR_EFFECTIVENESS)
+                    ref_bonus = stat_mult(ncomp.stats.component_type_id, _STAT_REFLECTOR_EFFECTIVENESS)
                     reflector_mult += 0.1 * ref_bonus
-                if ncomp.stats.heat_capacity > 0:
-                    absorber_count += 1
 
             power *= reflector_mult * overheat_mult
 
@@ -556,7 +814,7 @@ class Simulation:
             comp.last_heat = heat
 
             total_power += power
-            if absorber_count == 0:
+            if not absorbers:
                 total_heat_to_reactor += heat
 
         return total_power, total_heat_to_reactor
@@ -572,37 +830,24 @@ class Simulation:
         """
         if self.grid is None:
             return
-        for x, y, z, comp in self.grid.iter_cells():
-            if comp is None or comp.depleted:
-                continue
-            if comp.stats.type_of_component != "Exchanger":
+        heat_exchange_mult = self.heat_exchange_mult
+        # Zero-rate/zero-capacity exchangers and CantLoseHeat or zero-capacity
+        # partners were dropped in _rebuild_rate_cache.
+        for comp, base_rate, comp_cap, partners in self._exchanger_rates:
+            if comp.depleted:
                 continue
             # Exchanger's transfer rate = base SelfVentRate × upgrade × global mult
-            base_rate = comp.stats.self_vent_rate
-            if base_rate <= 0:
-                continue
-            rate = base_rate * self._stat_mult(
-                comp.stats.component_type_id, StatCategory.ADJACENT_TRANSFER_RATE
-            ) * self.heat_exchange_mult
-            comp_cap = self.get_effective_heat_capacity(comp)
-            if comp_cap <= 0:
-                continue
+            rate = base_rate * heat_exchange_mult
 
-            for nx, ny, nz in self.grid.neighbors(x, y, z):
-                ncomp = self.grid.get(nx, ny, nz)
-                if ncomp is None or ncomp.depleted:
+            for ncomp, ncap in partners:
+                if ncomp.depleted:
                     continue
-                # Skip CantLoseHeat components (0xCA=1): Reflectors + ExtremeCoolant
-                if ncomp.stats.cant_lose_heat:
-                    continue
-                ncap = self.get_effective_heat_capacity(ncomp)
-                if ncap <= 0:
+                # Two cold components are already at equilibrium
+                if comp.heat == 0.0 and ncomp.heat == 0.0:
                     continue
                 # Pooled equilibrium: target fill = combined heat / combined cap
                 total_heat = comp.heat + ncomp.heat
                 total_cap = comp_cap + ncap
-                if total_cap <= 0:
-                    continue
                 target_ratio = max(0.0, min(1.0, total_heat / total_cap))
                 target_neighbor = target_ratio * ncap
                 delta = target_neighbor - ncomp.heat  # positive = neighbor needs more
@@ -621,18 +866,12 @@ class Simulation:
         """
         if self.grid is None:
             return
-        for comp in self.components:
-            if comp.stats.type_of_component != "Coolant" or comp.stats.name != "Coolant6":
-                continue
+        for comp, ring in self._extreme_coolants:
             if comp.depleted:
                 continue
-            for nx, ny, nz in self.grid.manhattan_neighbors(comp.grid_x, comp.grid_y, 0, radius=2):
-                ncomp = self.grid.get(nx, ny, nz)
-                if ncomp is None:
-                    continue
-                if ncomp.stats.heat_capacity <= 0:
-                    continue
-                if ncomp.stats.cant_lose_heat:
+            # ring holds only neighbors with heat capacity and without CantLoseHeat
+            for ncomp in ring:
+                if ncomp.heat == 0.0:
                     continue
                 absorbed = ncomp.heat * 0.1
                 ncomp.heat -= absorbed
@@ -647,21 +886,20 @@ class Simulation:
         Inlets/Outlets use ReactorTransferRate (stat 10) and don't self-vent.
         """
         total_vented = 0.0
-        for comp in self.components:
-            if comp.stats.self_vent_rate <= 0:
-                continue
-            # RE: In the binary, only Vents have SelfVentRate > 0.
-            # Exchangers/Inlets/Outlets store their rate in different stat slots.
-            if comp.stats.type_of_component in ("Exchanger", "Inlet", "Outlet"):
-                continue
-            vent_bonus = self._stat_mult(comp.stats.component_type_id, StatCategory.SELF_VENT_RATE)
-            rate = comp.stats.self_vent_rate * vent_bonus * self.self_vent_mult
-            vented = min(comp.heat, rate)
-            comp.heat -= vented
+        self_vent_mult = self.self_vent_mult
+        # RE: In the binary, only Vents have SelfVentRate > 0.
+        # Exchangers/Inlets/Outlets store their rate in different stat slots,
+        # so they are left out of _vent_comps.
+        for comp, base_rate in self._vent_rates:
+            if comp.heat == 0.0:
+                continue  # nothing to vent (cool/idle vents are the common case)
+            rate = base_rate * self_vent_mult
+            heat = comp.heat
+            vented = min(heat, rate)
+            heat -= vented
             total_vented += vented
-            # Clamp small residuals
-            if comp.heat < 0.01:
-                comp.heat = 0.0
+            # Clamp small residuals (single write back to the component)
+            comp.heat = 0.0 if heat < 0.01 else heat
         self.store.total_heat_dissipated += total_vented
         self.store.heat_dissipated_this_game += total_vented
         return total_vented
@@ -673,70 +911,50 @@ class Simulation:
 
         # --- Pass 1: Pre-calculate total outlet capacity for distribution ratio ---
         total_outlet_capacity = 0.0
-        for comp in self.components:
-            if comp.stats.reactor_vent_rate <= 0 or comp.depleted:
-                continue
-            if comp.stats.type_of_component != "Outlet":
+        heat_exchange_mult = self.heat_exchange_mult
+        for comp, _is_outlet, absorbers, base_rate in self._outlet_rates:
+            if comp.depleted or not absorbers:
                 continue
-            rate = comp.stats.reactor_vent_rate * self._stat_mult(
-                comp.stats.component_type_id, StatCategory.REACTOR_TRANSFER_RATE
-            ) * self.heat_exchange_mult
-            # Count neighbors with heat_capacity > 0 (0xC9 HeatAbsorb flag)
-            absorber_count = 0
-            for nx, ny, nz in self.grid.neighbors(comp.grid_x, comp.grid_y, 0):
-                ncomp = self.grid.get(nx, ny, nz)
-                if ncomp is not None and ncomp.stats.heat_capacity > 0:
-                    absorber_count += 1
-            if absorber_count > 0:
-                total_outlet_capacity += absorber_count * rate
+            rate = base_rate * heat_exchange_mult
+            # Absorbers are the neighbors with heat_capacity > 0 (0xC9 HeatAbsorb flag)
+            total_outlet_capacity += len(absorbers) * rate
+
+        # Reactor heat is accumulated in a local and written back once
+        reactor_heat = self.reactor_heat
 
         # Distribution ratio: how much of reactor heat can outlets move this tick
         if total_outlet_capacity > 0:
-            dist_ratio = max(0.0, min(1.0, self.reactor_heat / total_outlet_capacity))
+            dist_ratio = max(0.0, min(1.0, reactor_heat / total_outlet_capacity))
         else:
             dist_ratio = 0.0
 
         # --- Pass 2: Process inlets and outlets ---
-        for comp in self.components:
-            if comp.stats.reactor_vent_rate <= 0 or comp.depleted:
+        for comp, is_outlet, targets, base_rate in self._hull_rates:
+            if comp.depleted:
                 continue
-            rate = comp.stats.reactor_vent_rate * self._stat_mult(
-                comp.stats.component_type_id, StatCategory.REACTOR_TRANSFER_RATE
-            ) * self.heat_exchange_mult
-
-            if comp.stats.type_of_component == "Inlet":
-                # Inlet: pull heat from neighbors into reactor hull
-                for nx, ny, nz in self.grid.neighbors(comp.grid_x, comp.grid_y, 0):
-                    ncomp = self.grid.get(nx, ny, nz)
-                    if ncomp is None:
-                        continue
-                    # Skip CantLoseHeat flag (0xCA): Reflectors + ExtremeCoolant
-                    if ncomp.stats.cant_lose_heat:
-                        continue
+            rate = base_rate * heat_exchange_mult
+
+            if not is_outlet:
+                # Inlet: pull heat from neighbors (CantLoseHeat already excluded) into reactor hull
+                for ncomp in targets:
                     transfer = min(rate, ncomp.heat)
                     if transfer > 0:
                         ncomp.heat -= transfer
-                        self.reactor_heat += transfer
+                        reactor_heat += transfer
 
-            elif comp.stats.type_of_component == "Outlet":
+            else:
                 # Outlet: push reactor heat into neighboring heat absorbers
                 if total_outlet_capacity <= 0:
                     continue
-                absorber_count = 0
-                for nx, ny, nz in self.grid.neighbors(comp.grid_x, comp.grid_y, 0):
-                    ncomp = self.grid.get(nx, ny, nz)
-                    if ncomp is not None and ncomp.stats.heat_capacity > 0:
-                        absorber_count += 1
+                absorber_count = len(targets)
                 if absorber_count == 0:
                     continue
-                transfer_total = min(dist_ratio * rate * absorber_count, self.reactor_heat)
+                transfer_total = min(dist_ratio * rate * absorber_count, reactor_heat)
                 transfer_per = transfer_total / absorber_count
-                for nx, ny, nz in self.grid.neighbors(comp.grid_x, comp.grid_y, 0):
-                    ncomp = self.grid.get(nx, ny, nz)
-                    if ncomp is not None and ncomp.stats.heat_capacity > 0:
-                        self.reactor_heat -= transfer_per
-                        ncomp.heat += transfer_per
-        self.reactor_heat = max(0.0, self.reactor_heat)
+                for ncomp in targets:
+                    reactor_heat -= transfer_per
+                    ncomp.heat += transfer_per
+        self.reactor_heat = max(0.0, reactor_heat)
 
     def _check_explosions(self) -> None:
         """RE: fn 10429 — heat overflow damage + component/reactor explosions.
@@ -753,53 +971,69 @@ class Simulation:
         is_meltdown = (max_heat > 0 and self.reactor_heat >= 2.0 * max_heat)
 
         # Heat overflow: when reactor heat > capacity, distribute 5% of excess to components
-        if self.reactor_heat > max_heat and max_heat > 0:
-            overflow = self.reactor_heat - max_heat
-            for comp in self.components:
-                if comp.stats.heat_capacity > 0 and not comp.depleted:
-                    comp.heat += overflow * 0.05
+        overflowing = self.reactor_heat > max_heat and max_heat > 0
+        overflow_heat = (self.reactor_heat - max_heat) * 0.05 if overflowing else 0.0
 
-        # Build destruction list
+        # Single pass: apply overflow, then test the component against its capacity.
+        # Each test only reads the component's own heat, so fusing keeps results.
         to_destroy = []
         for comp in self.components:
             if comp.depleted:
                 continue
             if comp.stats.heat_capacity > 0:
-                eff_cap = comp.stats.heat_capacity * self._stat_mult(
-                    comp.stats.component_type_id, StatCategory.HEAT_CAPACITY)
-                if is_meltdown or comp.heat >= eff_cap:
+                if overflowing:
+                    comp.heat += overflow_heat
+                # eff_heat_cap is current: the rate cache was refreshed this tick
+                if is_meltdown or comp.heat >= comp.eff_heat_cap:
                     to_destroy.append(comp)
             else:
                 # No heat capacity: only destroyed on meltdown
                 if is_meltdown:
                     to_destroy.append(comp)
 
+        if not to_destroy:
+            # Clamp small heat residuals on surviving components
+            for comp in self.components:
+                if comp.heat < 0.01:
+                    comp.heat = 0.0
+            return
+
         # Execute destruction — spawn explosion effect at each destroyed component's position
+        self.explosions.extend([ExplosionEffect(comp.grid_x, comp.grid_y) for comp in to_destroy])
+        grid_set = self.grid.set
         for comp in to_destroy:
-            if self.grid is not None:
-                self.explosions.append(ExplosionEffect(grid_x=comp.grid_x, grid_y=comp.grid_y))
-            self.grid.set(comp.grid_x, comp.grid_y, comp.grid_z, None)
-            try:
-                self.components.remove(comp)
-            except ValueError:
-                pass
-
-        if to_destroy:
-            self._pulses_dirty = True
-            self.recompute_max_capacities()
+            grid_set(comp.grid_x, comp.grid_y, comp.grid_z, None)
+        destroyed = {id(comp) for comp in to_destroy}
 
-        # Clamp small heat residuals on surviving components
+        # Drop destroyed components in one pass (list.remove per component is
+        # O(n) and compares dataclass fields), clamping residuals on survivors
+        survivors = []
         for comp in self.components:
+            if id(comp) in destroyed:
+                continue
             if comp.heat < 0.01:
                 comp.heat = 0.0
+            survivors.append(comp)
+        self.components[:] = survivors
+
+        self._pulses_dirty = True
+        self._type_counts_dirty = True
+        self.recompute_max_capacities()
 
     def update_explosions(self, dt: float) -> None:
         """Advance explosion animations. Runs even when paused (cosmetic only)."""
-        for effect in self.explosions:
+        effects = self.explosions
+        if not effects:
+            return  # common case: nothing animating this frame
+        # Advance and compact in place, dropping finished animations (12 frames total)
+        keep = 0
+        for effect in effects:
             effect.time += dt
             effect.frame = int(effect.time * effect.fps)
-        # Remove finished animations (12 frames total)
-        self.explosions = [e for e in self.explosions if e.frame < 12]
+            if effect.frame < 12:
+                effects[keep] = effect
+                keep += 1
+        del effects[keep:]
 
     # ── Public interface ──────────────────────────────────────────
 
@@ -825,8 +1059,10 @@ class Simulation:
     def vent_heat(self) -> float:
         """RE: unnamed_function_10506 — manual vent button.
         Vents min(reactor_heat, manual_vent_amount) from reactor hull."""
-        vented = min(self.reactor_heat, self.manual_vent_amount)
-        self.reactor_heat = max(0.0, self.reactor_heat - vented)
+        heat = self.reactor_heat
+        amount = self.manual_vent_amount
+        vented = heat if heat < amount else amount
+        self.reactor_heat = max(0.0, heat - vented)
         self.store.heat = self.reactor_heat
         return vented
 
@@ -834,19 +1070,21 @@ class Simulation:
         """RE: unnamed_function_10415 — vent rate shown on button label.
         = maxHeat * autoVentUpgradeMult * 0.01 + maxHeat * 0.0001
         With no upgrades (autoVentMult=1.0→bonus-1=0): rate = maxHeat * 0.0001"""
-        auto_vent_bonus = self.upgrade_manager.get_upgrade_stat_bonus(1, StatCategory.AUTO_VENT_RATE)
+        auto_vent_bonus = self.upgrade_manager.get_upgrade_stat_bonus(1, _STAT_AUTO_VENT_RATE)
         return self.max_reactor_heat * (auto_vent_bonus - 1.0) * 0.01 + self.max_reactor_heat * 0.0001
 
     def vent_dissipation_capacity_per_tick(self) -> float:
         """Maximum per-tick heat dissipation to air from vent-like components."""
         total = 0.0
+        vent_bonuses = self._stat_lut(_STAT_SELF_VENT_RATE)
+        self_vent_mult = self.self_vent_mult
         for comp in self.components:
-            if comp.depleted or comp.stats.self_vent_rate <= 0:
+            stats = comp.stats
+            if comp.depleted or stats.self_vent_rate <= 0:
                 continue
-            if comp.stats.type_of_component in ("Exchanger", "Inlet", "Outlet"):
+            if stats.type_of_component in ("Exchanger", "Inlet", "Outlet"):
                 continue
-            vent_bonus = self._stat_mult(comp.stats.component_type_id, StatCategory.SELF_VENT_RATE)
-            total += comp.stats.self_vent_rate * vent_bonus * self.self_vent_mult
+            total += stats.self_vent_rate * vent_bonuses[stats.component_type_id] * self_vent_mult
         return total
 
     def vent_dissipation_capacity_for(self, comp: ReactorComponent) -> float:
@@ -855,7 +1093,7 @@ class Simulation:
             return 0.0
         if comp.stats.type_of_component != "Vent":
             return 0.0
-        vent_bonus = self._stat_mult(comp.stats.component_type_id, StatCategory.SELF_VENT_RATE)
+        vent_bonus = self._stat_mult(comp.stats.component_type_id, _STAT_SELF_VENT_RATE)
         return comp.stats.self_vent_rate * vent_bonus * self.self_vent_mult
 
     def active_dissipation_capacity_per_tick(self) -> float:
@@ -884,7 +1122,9 @@ class Simulation:
         """Maximum per-tick reactor->component transfer capacity from outlets."""
         total = 0.0
         for comp in self.components:
-            total += self.outlet_transfer_capacity_for(comp)
+            # Non-outlets contribute 0; skip them before the method call.
+            if comp.stats.type_of_component == "Outlet":
+                total += self.outlet_transfer_capacity_for(comp)
         return total
 
     def outlet_transfer_capacity_for(self, comp: ReactorComponent) -> float:
@@ -908,7 +1148,7 @@ class Simulation:
         if comp.stats.type_of_component != "Outlet":
             return 0.0
         return comp.stats.reactor_vent_rate * self._stat_mult(
-            comp.stats.component_type_id, StatCategory.REACTOR_TRANSFER_RATE
+            comp.stats.component_type_id, _STAT_REACTOR_TRANSFER_RATE
         ) * self.heat_exchange_mult
 
     def max_adjacent_vent_capacity_for(self, comp: ReactorComponent) -> float:
@@ -941,8 +1181,11 @@ class Simulation:
         is open and ticks are suppressed.
         """
         self.reactor_heat = max(0.0, self.reactor_heat)
+        if self._caps_dirty:
+            self.recompute_max_capacities()
         self.upgrade_manager.prepare_multipliers(self)
         if self._pulses_dirty:
+            self._rebuild_layout_cache()
             self._distribute_pulses()
             self._pulses_dirty = False
 
@@ -965,7 +1208,7 @@ class Simulation:
         """RE: unnamed_function_10417 — auto-sell rate shown on sell button.
         = (autoSellBonus - 1) * maxPower * 0.01
         With no upgrades (bonus=1.0): 0"""
-        auto_sell_bonus = self.upgrade_manager.get_upgrade_stat_bonus(1, StatCategory.AUTO_SELL_RATE)
+        auto_sell_bonus = self.upgrade_manager.get_upgrade_stat_bonus(1, _STAT_AUTO_SELL_RATE)
         return (auto_sell_bonus - 1.0) * self.max_reactor_power * 0.01
 
     def calculate_prestige_ep(self) -> int:
@@ -978,8 +1221,37 @@ class Simulation:
         value = min(self.store.total_power_produced, self.store.total_heat_dissipated)
         if value < 1e12:
             return 0
-        total_ep = int(math.floor(4.0 ** (math.log10(value) - 12.0)))
-        return max(0, total_ep - int(self.store.total_exotic_particles))
+        highwater = int(self.store.total_exotic_particles)
+        if value < self._ep_threshold_for(highwater):
+            return 0
+        # Totals only move on ticks, so most frames reuse the last result.
+        # (A single-pow closed form floors differently near EP boundaries.)
+        memo_value, total_ep = self._prestige_ep_memo
+        if value != memo_value:
+            # value >= 1e12 makes the power >= 1, so truncation is the floor.
+            total_ep = int(4.0 ** (math.log10(value) - 12.0))
+            self._prestige_ep_memo = (value, total_ep)
+        return max(0, total_ep - highwater)
+
+    def _ep_threshold_for(self, highwater: int) -> float:
+        """Lower bound on the value needed to earn EP beyond highwater.
+
+        Inverts the formula for highwater + 1 and shaves a 1e-9 relative
+        margin, far wider than the rounding error of log10/pow, so values
+        below it are guaranteed to yield no new EP.
+        """
+        cached_highwater, threshold = self._prestige_ep_threshold
+        if cached_highwater == highwater:
+            return threshold
+        if highwater < 0:
+            threshold = 0.0
+        else:
+            try:
+                threshold = 10.0 ** (12.0 + math.log(highwater + 1, 4.0)) * (1.0 - 1e-9)
+            except OverflowError:
+                threshold = math.inf  # beyond what any finite total can reach
+        self._prestige_ep_threshold = (highwater, threshold)
+        return threshold
 
     def do_prestige(self) -> int:
         """RE: unnamed_function_10481 — execute prestige.
@@ -996,9 +1268,7 @@ class Simulation:
 
         # Clear grid
         if self.grid is not None:
-            for x, y, z, comp in list(self.grid.iter_cells()):
-                if comp is not None:
-                    self.grid.set(x, y, z, None)
+            self.grid.clear_all()
         self.components.clear()
 
         # Zero per-game resources (lifetime totals persist)
@@ -1016,10 +1286,12 @@ class Simulation:
         for u in self.upgrade_manager.upgrades:
             if not u.is_prestige:
                 u.level = 0
+        self.upgrade_manager.invalidate()
 
         self.selected_component_index = -1
         self.replace_mode = True  # RE: fn 10481 sets Controller+0xA1
         self._pulses_dirty = True
+        self._type_counts_dirty = True
         self.recompute_max_capacities()
 
         # Prestige state machine: enter Phase C (refund window)
@@ -1037,6 +1309,7 @@ class Simulation:
         for u in self.upgrade_manager.upgrades:
             if u.is_prestige:
                 u.level = 0
+        self.upgrade_manager.invalidate()
         self.store.exotic_particles = self.store.total_exotic_particles
         self.prestige_can_refund = False
 
@@ -1060,32 +1333,57 @@ class Simulation:
     def recompute_max_capacities(self) -> None:
         """RE: unnamed_function_10412/10413 — recompute maxHeat and maxPower.
         Base = GetStatCached(1, stat) * 1000.0 + sum of component contributions.
-        Upgrade multipliers: power_cap_mult / heat_cap_mult scale the base."""
-        heat_base_mult = self.upgrade_manager.get_upgrade_stat_bonus(1, StatCategory.REACTOR_HEAT_CAP_INCREASE)
-        power_base_mult = self.upgrade_manager.get_upgrade_stat_bonus(1, StatCategory.REACTOR_POWER_CAP_INCREASE)
+        Upgrade multipliers: power_cap_mult / heat_cap_mult scale the base.
+
+        place_component/remove_component only mark the capacities dirty; the
+        recompute runs on the next read or tick, so bulk placement sums once."""
+        self._caps_dirty = False
+        heat_base_mult = self.upgrade_manager.get_upgrade_stat_bonus(1, _STAT_REACTOR_HEAT_CAP_INCREASE)
+        power_base_mult = self.upgrade_manager.get_upgrade_stat_bonus(1, _STAT_REACTOR_POWER_CAP_INCREASE)
         base_heat = heat_base_mult * 1000.0
         base_power = power_base_mult * 100.0
+        heat_inc_bonuses = self._stat_lut(_STAT_REACTOR_HEAT_CAP_INCREASE)
+        power_inc_bonuses = self._stat_lut(_STAT_REACTOR_POWER_CAP_INCREASE)
         for comp in self.components:
             # Per-component contribution scaled by upgrade bonus for that component type
-            tid = comp.stats.component_type_id
-            heat_inc_bonus = self._stat_mult(tid, StatCategory.REACTOR_HEAT_CAP_INCREASE)
-            power_inc_bonus = self._stat_mult(tid, StatCategory.REACTOR_POWER_CAP_INCREASE)
-            base_heat += comp.stats.reactor_heat_capacity_increase * heat_inc_bonus
-            base_power += comp.stats.reactor_power_capacity_increase * power_inc_bonus
-        self.max_reactor_heat = base_heat * self.heat_cap_mult
-        self.max_reactor_power = base_power * self.power_cap_mult
+            stats = comp.stats
+            tid = stats.component_type_id
+            base_heat += stats.reactor_heat_capacity_increase * heat_inc_bonuses[tid]
+            base_power += stats.reactor_power_capacity_increase * power_inc_bonuses[tid]
+        self._max_reactor_heat = base_heat * self.heat_cap_mult
+        self._max_reactor_power = base_power * self.power_cap_mult
+
+    def _type_prefix_totals(self, type_prefix: str) -> Tuple[int, int]:
+        """Return (count, tier_sum) of live components matching type_prefix."""
+        if self._type_counts_dirty:
+            self._type_totals.clear()
+            self._prefix_totals.clear()
+            for comp in self.components:
+                if comp.depleted:
+                    continue
+                stats = comp.stats
+                key = (stats.type_of_component, stats.name)
+                totals = self._type_totals.get(key)
+                if totals is None:
+                    totals = self._type_totals[key] = [0, 0]
+                totals[0] += 1
+                totals[1] += stats.tier
+            self._type_counts_dirty = False
+        cached = self._prefix_totals.get(type_prefix)
+        if cached is not None:
+            return cached
+        count = 0
+        tier_sum = 0
+        for (kind, name), (n, tiers) in self._type_totals.items():
+            if (kind and kind.startswith(type_prefix)) or name.startswith(type_prefix):
+                count += n
+                tier_sum += tiers
+        result = self._prefix_totals[type_prefix] = (count, tier_sum)
+        return result
 
     def count_components_of_type(self, type_prefix: str) -> int:
         """Count placed components whose type_of_component or name starts with prefix."""
-        count = 0
-        for comp in self.components:
-            if comp.depleted:
-                continue
-            if comp.stats.type_of_component and comp.stats.type_of_component.startswith(type_prefix):
-                count += 1
-            elif comp.stats.name.startswith(type_prefix):
-                count += 1
-        return count
+        return self._type_prefix_totals(type_prefix)[0]
 
     def sum_component_tiers(self, type_prefix: str) -> int:
         """RE: unnamed_function_10447 — sum Tier field for placed components of a type.
@@ -1094,15 +1392,7 @@ class Simulation:
         whose TypeOfComponent (offset 0x14) matches. A tier-1 component
         contributes 1, tier-2 contributes 2, etc.
         """
-        total = 0
-        for comp in self.components:
-            if comp.depleted:
-                continue
-            if comp.stats.type_of_component and comp.stats.type_of_component.startswith(type_prefix):
-                total += comp.stats.tier
-            elif comp.stats.name.startswith(type_prefix):
-                total += comp.stats.tier
-        return total
+        return self._type_prefix_totals(type_prefix)[1]
 
     def get_component_cost(self, comp: ComponentTypeStats) -> float:
         """Return effective cost of a component after applying discount upgrades."""
@@ -1111,12 +1401,12 @@ class Simulation:
     def get_effective_max_durability(self, comp: ReactorComponent) -> float:
         """Return upgraded max durability for display (Durability: X / Y)."""
         return comp.stats.max_durability * self._stat_mult(
-            comp.stats.component_type_id, StatCategory.MAX_DURABILITY)
+            comp.stats.component_type_id, _STAT_MAX_DURABILITY)
 
     def get_effective_heat_capacity(self, comp: ReactorComponent) -> float:
         """Return upgraded heat capacity for display (Heat: X / Y)."""
         return comp.stats.heat_capacity * self._stat_mult(
-            comp.stats.component_type_id, StatCategory.HEAT_CAPACITY)
+            comp.stats.component_type_id, _STAT_HEAT_CAPACITY)
 
     @staticmethod
     def can_replace(existing: ReactorComponent, new_type: ComponentTypeStats) -> bool:
@@ -1149,22 +1439,24 @@ class Simulation:
         Fuel cells (have pulses_produced > 0) always return $0.
         """
         stats = comp.stats
+        # Fuel cells refund $0 (CellData check in original)
+        if stats.pulses_produced > 0:
+            return 0.0
         value = stats.cost
 
         # Heat penalty: quadratic degradation based on stored heat
         if stats.heat_capacity > 0.0:
-            heat_ratio = 1.0 - min(1.0, comp.heat / stats.heat_capacity)
+            heat_frac = comp.heat / stats.heat_capacity
+            heat_ratio = 1.0 - heat_frac if heat_frac < 1.0 else 0.0
             value *= heat_ratio * heat_ratio
 
         # Durability penalty: quadratic degradation based on remaining durability
         if stats.max_durability > 0.0:
-            dur_ratio = max(0.0, comp.durability / stats.max_durability)
+            dur_ratio = comp.durability / stats.max_durability
+            if not dur_ratio > 0.0:
+                dur_ratio = 0.0
             value *= dur_ratio * dur_ratio
 
-        # Fuel cells refund $0 (CellData check in original)
-        if stats.pulses_produced > 0:
-            value = 0.0
-
         return value
 
     def reset_game(self) -> None:
@@ -1173,9 +1465,7 @@ class Simulation:
         RE: fn 10330 resets ALL upgrades (including prestige) on hard reset.
         """
         if self.grid is not None:
-            for x, y, z, comp in list(self.grid.iter_cells()):
-                if comp is not None:
-                    self.grid.set(x, y, z, None)
+            self.grid.clear_all()
         self.components.clear()
         self.store.money = 0.0
         self.store.total_money = 0.0
@@ -1195,9 +1485,11 @@ class Simulation:
         self.selected_component_index = -1
         self.view_mode = "reactor"
         self._pulses_dirty = True
+        self._type_counts_dirty = True
         # Reset ALL upgrades (RE: fn 10330)
         for u in self.upgrade_manager.upgrades:
             u.level = 0
+        self.upgrade_manager.invalidate()
         # Clear prestige state flags
         self.prestige_confirming = False
         self.prestige_can_refund = False
@@ -1213,14 +1505,19 @@ class Simulation:
         component.grid_x = x
         component.grid_y = y
         component.grid_z = z
+        stats = component.stats
+        component.eff_heat_cap = stats.heat_capacity * self._stat_mult(
+            stats.component_type_id, _STAT_HEAT_CAPACITY)
+        component.eff_max_durability = stats.max_durability * self._stat_mult(
+            stats.component_type_id, _STAT_MAX_DURABILITY)
         # Set initial durability using upgraded max (RE: placement uses current upgrade level)
-        if component.stats.max_durability > 0:
-            dur_mult = self._stat_mult(component.stats.component_type_id, StatCategory.MAX_DURABILITY)
-            component.durability = component.stats.max_durability * dur_mult
+        if stats.max_durability > 0:
+            component.durability = component.eff_max_durability
         self.grid.set(x, y, z, component)
         self.components.append(component)
         self._pulses_dirty = True
-        self.recompute_max_capacities()
+        self._type_counts_dirty = True
+        self._caps_dirty = True
         return True
 
     def remove_component(self, x: int, y: int, z: int = 0) -> Optional[ReactorComponent]:
@@ -1230,12 +1527,16 @@ class Simulation:
         if existing is None:
             return None
         self.grid.set(x, y, z, None)
-        try:
-            self.components.remove(existing)
-        except ValueError:
-            pass
+        # Match by identity: list.remove would run the dataclass __eq__
+        # (field-by-field, stats included) against every earlier component.
+        components = self.components
+        for i, comp in enumerate(components):
+            if comp is existing:
+                del components[i]
+                break
         self._pulses_dirty = True
-        self.recompute_max_capacities()
+        self._type_counts_dirty = True
+        self._caps_dirty = True
         return existing
 
     def selected_component(self) -> Optional[ComponentTypeStats]:
@@ -1259,6 +1560,17 @@ class Simulation:
                         self.selected_component_index = -1
                     page = fallback
                     break
+        # Visibility only depends on upgrade levels, so the filtered, sorted
+        # page is reused until the upgrade version moves. Callers must not
+        # mutate the returned list.
+        version = self.upgrade_manager.version
+        if self._shop_page_version != version or self._shop_page_source is not self.shop_components:
+            self._shop_page_cache.clear()
+            self._shop_page_version = version
+            self._shop_page_source = self.shop_components
+        cached = self._shop_page_cache.get(page)
+        if cached is not None:
+            return cached
         components = [comp for comp in self.shop_components if comp.shop_page == page]
         if not components:
             components = [comp for comp in self.shop_components if _component_shop_page(comp.name) == page]
@@ -1272,10 +1584,9 @@ class Simulation:
                 if mgr.upgrades[comp.required_upgrade].level == 0:
                     continue
             visible.append(comp)
-        return sorted(
-            visible,
-            key=lambda comp: (comp.shop_row, comp.shop_col, comp.shop_order, comp.name),
-        )
+        visible.sort(key=lambda comp: (comp.shop_row, comp.shop_col, comp.shop_order, comp.name))
+        self._shop_page_cache[page] = visible
+        return visible
 
     def shop_page_locked(self, page: int) -> bool:
         if page <= 1:
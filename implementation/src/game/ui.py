@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import bisect
+import functools
 import sys
 from dataclasses import dataclass, field
 import math
 import re
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 _WEB = sys.platform == "emscripten"
 
@@ -14,12 +17,15 @@ from raylib_compat import (
     Texture2D,
     begin_scissor_mode,
     draw_rectangle,
-    draw_rectangle_lines,
+    draw_rectangle_bordered,
     draw_text,
+    draw_text_batch,
+    draw_texture_batch,
     draw_texture_ex,
     draw_texture_pro,
     end_scissor_mode,
     measure_text,
+    texture_source_rect,
     Vector2,
 )
 
@@ -29,6 +35,88 @@ from game.simulation import ReactorComponent, Simulation
 from game.upgrades import UpgradeManager, UpgradeType
 
 
+# Draw colors, built once at import rather than per frame.
+# Shared text and tint colors
+_WHITE = Color(255, 255, 255, 255)
+_TEXT_COLOR = Color(230, 230, 230, 255)
+_LOCKED_TINT = Color(160, 160, 160, 255)
+_WARNING_COLOR = Color(255, 220, 90, 255)
+_GOLD_COLOR = Color(245, 200, 70, 255)
+
+# Warning badge
+_BADGE_SHADOW_COLOR = Color(18, 14, 8, 230)
+_BADGE_FILL_COLOR = Color(62, 46, 14, 235)
+_BADGE_TEXT_COLOR = Color(255, 236, 150, 255)
+
+# Heat / power bars
+_HEAT_FILL_COLOR = Color(240, 80, 80, 200)
+_HEAT_TEXT_COLOR = Color(240, 80, 80, 255)
+_POWER_FILL_COLOR = Color(80, 200, 255, 200)
+_POWER_TEXT_COLOR = Color(80, 200, 255, 255)
+
+# Vent / sell buttons
+_BUTTON_FALLBACK_COLOR = Color(60, 60, 70, 255)
+_BUTTON_LABEL_COLOR = Color(240, 240, 240, 255)
+
+# Upgrade grid
+_UPGRADE_BG_COLOR = Color(40, 50, 70, 255)
+_UPGRADE_BG_LOCKED_COLOR = Color(30, 30, 40, 255)
+_UPGRADE_BORDER_COLOR = Color(80, 90, 110, 255)
+_UPGRADE_LEVEL_COLOR = Color(200, 255, 200, 255)
+
+# Prestige button phases (refund / confirm / normal)
+_PRESTIGE_REFUND_BG = Color(40, 100, 80, 255)
+_PRESTIGE_REFUND_HOVER = Color(60, 130, 100, 255)
+_PRESTIGE_REFUND_BORDER = Color(70, 140, 110, 255)
+_PRESTIGE_CONFIRM_BG = Color(140, 90, 30, 255)
+_PRESTIGE_CONFIRM_HOVER = Color(180, 110, 40, 255)
+_PRESTIGE_CONFIRM_BORDER = Color(190, 130, 50, 255)
+_PRESTIGE_BG = Color(70, 50, 100, 255)
+_PRESTIGE_HOVER = Color(100, 70, 140, 255)
+_PRESTIGE_BORDER = Color(100, 80, 130, 255)
+_PRESTIGE_DISABLED_BG = Color(40, 35, 50, 255)
+_PRESTIGE_DISABLED_TEXT = Color(140, 140, 140, 255)
+
+# Reset button
+_RESET_CONFIRM_HOVER = Color(180, 50, 50, 255)
+_RESET_CONFIRM_BG = Color(140, 40, 40, 255)
+_RESET_HOVER = Color(80, 40, 40, 255)
+_RESET_BG = Color(60, 30, 30, 255)
+_RESET_BORDER = Color(120, 60, 60, 255)
+
+# Export / import buttons
+_EXPORT_OLD_HOVER = Color(60, 80, 60, 255)
+_EXPORT_OLD_BG = Color(40, 60, 40, 255)
+_EXPORT_OLD_BORDER = Color(80, 120, 80, 255)
+_EXPORT_NEW_HOVER = Color(50, 80, 90, 255)
+_EXPORT_NEW_BG = Color(35, 60, 70, 255)
+_EXPORT_NEW_BORDER = Color(70, 110, 125, 255)
+_IMPORT_HOVER = Color(50, 60, 80, 255)
+_IMPORT_BG = Color(35, 45, 60, 255)
+_IMPORT_BORDER = Color(70, 90, 120, 255)
+
+# Help panel
+_HELP_TEXT_COLOR = Color(210, 210, 220, 255)
+_HELP_DIVIDER_COLOR = Color(80, 80, 100, 180)
+_HELP_TRACK_COLOR = Color(40, 40, 50, 160)
+_HELP_THUMB_COLOR = Color(160, 160, 180, 200)
+
+# Zero origin for draw_texture_pro
+_ORIGIN = Vector2(0, 0)
+
+# Sprite positions are consumed by the draw call that receives them, so
+# struct bindings can reuse one scratch Vector2. Tuple-backed bindings
+# (cffi raylib, web) cannot be mutated and just build a fresh tuple.
+_SCRATCH_V2 = Vector2(0, 0)
+if isinstance(_SCRATCH_V2, tuple):
+    _v2 = Vector2
+else:
+    def _v2(x: float, y: float):
+        _SCRATCH_V2.x = x
+        _SCRATCH_V2.y = y
+        return _SCRATCH_V2
+
+
 @dataclass
 class Ui:
     heat_icon: Optional[Texture2D] = None
@@ -60,16 +148,43 @@ class Ui:
     help_scroll_y: float = 0.0  # scroll offset for help panel
     help_drag_active: bool = False  # drag-to-scroll state
     help_drag_last_y: float = 0.0
+    # Statistics panel draw list [(text, x, y, font)], reused while its inputs are unchanged
+    _stats_cache_key: Optional[tuple] = field(default=None, repr=False)
+    _stats_cache_draws: list = field(default_factory=list, repr=False)
+    # HUD and options label slot -> (inputs, cached layout) from the last frame that built it
+    _label_cache: dict = field(default_factory=dict, repr=False)
+    # Store slot geometry: (layout key, slots) and (layout key, components, slots)
+    _tab_slots_cache: Optional[tuple] = field(default=None, repr=False)
+    _item_slots_cache: Optional[tuple] = field(default=None, repr=False)
+    # (slots, bounds, comps, edges): hit-test data derived from the cached item slots
+    _item_slots_hit: Optional[tuple] = field(default=None, repr=False)
+    # (component_sprites, {(sprite name, box size): fit}) for help panel sprites
+    _sprite_fit_cache: Optional[tuple] = field(default=None, repr=False)
+    # positions table -> (sprites, upgrades, [(upgrade, row, col, icon, category)])
+    _upgrade_cells_cache: dict = field(default_factory=dict, repr=False)
+    # Top banner title/description layout: (inputs, title draw, description draws, y below).
+    # Shared by the reactor and upgrade views, which never draw in the same frame.
+    _info_cache: Optional[tuple] = field(default=None, repr=False)
+    # (scroll and content geometry, [(draw function, args)]): help body replayed while it holds still
+    _help_draws_cache: Optional[tuple] = field(default=None, repr=False)
+    # (state and cursor, [(draw function, args)]): options panel replayed on idle frames
+    _options_draws_cache: Optional[tuple] = field(default=None, repr=False)
+
+    def _label_memo(self, slot: str, key: tuple) -> Optional[tuple]:
+        """Return what slot cached under key, or None if its inputs changed."""
+        entry = self._label_cache.get(slot)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        return None
 
     @staticmethod
     def draw_warning_badge(x: int, y: int, size: int = 12) -> None:
         """Compact amber warning badge used for outlet bottleneck warnings."""
-        draw_rectangle(x + 1, y + 1, size, size, Color(18, 14, 8, 230))
-        draw_rectangle(x, y, size, size, Color(62, 46, 14, 235))
-        draw_rectangle_lines(x, y, size, size, Color(245, 200, 70, 255))
+        draw_rectangle(x + 1, y + 1, size, size, _BADGE_SHADOW_COLOR)
+        draw_rectangle_bordered(x, y, size, size, _BADGE_FILL_COLOR, _GOLD_COLOR)
         text_x = x + max(1, size // 2 - 2)
         text_y = y + max(-1, (size - 10) // 2 - 1)
-        draw_text("!", text_x, text_y, 10, Color(255, 236, 150, 255))
+        draw_text("!", text_x, text_y, 10, _BADGE_TEXT_COLOR)
 
     def draw(
         self,
@@ -92,30 +207,36 @@ class Ui:
             layout.heat_bar_y,
             int(layout.bar_width * heat_fill),
             layout.bar_height,
-            Color(240, 80, 80, 200),
+            _HEAT_FILL_COLOR,
         )
         # Heat icon + label
         icon_x = layout.heat_bar_x + 2
         icon_y = layout.heat_bar_y + 2
         text_x = icon_x
         if self.heat_icon is not None:
-            draw_texture_ex(self.heat_icon, Vector2(icon_x, icon_y), 0.0, 1.0, Color(255, 255, 255, 255))
+            draw_texture_ex(self.heat_icon, _v2(icon_x, icon_y), 0.0, 1.0, _WHITE)
             text_x += self.heat_icon.width + 6
         heat_delta = sim.last_heat_change
-        heat_sign = "+" if heat_delta >= 0 else ""
-        heat_label = (
-            f"{format_number_with_suffix(sim.reactor_heat, max_decimals=0)}/"
-            f"{format_number_with_suffix(sim.max_reactor_heat, max_decimals=0)} "
-            f"({heat_sign}{format_number_with_suffix(heat_delta, min_decimals=3)}/t)"
-        )
         heat_max_w = layout.heat_bar_x + layout.bar_width - text_x - 4
-        heat_font = _fit_font_size(heat_label, heat_max_w, 16)
+        # Labels only change when a displayed value does (at most once per tick)
+        key = (sim.reactor_heat, sim.max_reactor_heat, heat_delta, heat_max_w)
+        cached = self._label_memo("heat", key)
+        if cached is None:
+            heat_sign = "+" if heat_delta >= 0 else ""
+            heat_label = (
+                f"{format_number_with_suffix(sim.reactor_heat, max_decimals=0)}/"
+                f"{format_number_with_suffix(sim.max_reactor_heat, max_decimals=0)} "
+                f"({heat_sign}{format_number_with_suffix(heat_delta, min_decimals=3)}/t)"
+            )
+            cached = (heat_label, _fit_font_size(heat_label, heat_max_w, 16))
+            self._label_cache["heat"] = (key, cached)
+        heat_label, heat_font = cached
         draw_text(
             heat_label,
             text_x,
             layout.heat_bar_y + 6,
             heat_font,
-            Color(240, 80, 80, 255),
+            _HEAT_TEXT_COLOR,
         )
 
         # Power bar (RE: fill = stored_power / maxPower, clamped 0..1)
@@ -127,111 +248,129 @@ class Ui:
             layout.power_bar_y,
             int(layout.bar_width * power_fill),
             layout.bar_height,
-            Color(80, 200, 255, 200),
+            _POWER_FILL_COLOR,
         )
         # Power icon + label
         icon_x = layout.power_bar_x + 2
         icon_y = layout.power_bar_y + 2
         text_x = icon_x
         if self.power_icon is not None:
-            draw_texture_ex(self.power_icon, Vector2(icon_x, icon_y), 0.0, 1.0, Color(255, 255, 255, 255))
+            draw_texture_ex(self.power_icon, _v2(icon_x, icon_y), 0.0, 1.0, _WHITE)
             text_x += self.power_icon.width + 6
         power_delta = sim.last_power_change
-        power_sign = "+" if power_delta >= 0 else ""
-        power_label = (
-            f"{format_number_with_suffix(sim.stored_power, max_decimals=0)}/"
-            f"{format_number_with_suffix(sim.max_reactor_power, max_decimals=0)} "
-            f"({power_sign}{format_number_with_suffix(power_delta, min_decimals=3)}/t)"
-        )
         power_max_w = layout.power_bar_x + layout.bar_width - text_x - 4
-        power_font = _fit_font_size(power_label, power_max_w, 16)
+        key = (sim.stored_power, sim.max_reactor_power, power_delta, power_max_w)
+        cached = self._label_memo("power", key)
+        if cached is None:
+            power_sign = "+" if power_delta >= 0 else ""
+            power_label = (
+                f"{format_number_with_suffix(sim.stored_power, max_decimals=0)}/"
+                f"{format_number_with_suffix(sim.max_reactor_power, max_decimals=0)} "
+                f"({power_sign}{format_number_with_suffix(power_delta, min_decimals=3)}/t)"
+            )
+            cached = (power_label, _fit_font_size(power_label, power_max_w, 16))
+            self._label_cache["power"] = (key, cached)
+        power_label, power_font = cached
         draw_text(
             power_label,
             text_x,
             layout.power_bar_y + 6,
             power_font,
-            Color(80, 200, 255, 255),
+            _POWER_TEXT_COLOR,
         )
 
         # Cash display (with EP in upgrade/prestige views)
-        if sim.view_mode in ("upgrades", "prestige"):
-            money_text = (
-                f"${format_number_with_suffix(sim.store.money)}"
-                f"  EP: {format_number_with_suffix(sim.store.exotic_particles)}"
-                f" / {format_number_with_suffix(sim.store.total_exotic_particles)}"
-            )
-        else:
-            money_text = f"${format_number_with_suffix(sim.store.money)}"
-        font_size = _fit_font_size(money_text, layout.cash_w - 4, 16)
-        text_width = _measure(money_text, font_size)
+        show_ep = sim.view_mode in ("upgrades", "prestige")
+        key = (show_ep, sim.store.money, sim.store.exotic_particles,
+               sim.store.total_exotic_particles, layout.cash_w)
+        cached = self._label_memo("money", key)
+        if cached is None:
+            if show_ep:
+                money_text = (
+                    f"${format_number_with_suffix(sim.store.money)}"
+                    f"  EP: {format_number_with_suffix(sim.store.exotic_particles)}"
+                    f" / {format_number_with_suffix(sim.store.total_exotic_particles)}"
+                )
+            else:
+                money_text = f"${format_number_with_suffix(sim.store.money)}"
+            font_size = _fit_font_size(money_text, layout.cash_w - 4, 16)
+            cached = (money_text, font_size, _measure(money_text, font_size))
+            self._label_cache["money"] = (key, cached)
+        money_text, font_size, text_width = cached
         money_x = layout.cash_x + max(0, (layout.cash_w - text_width) // 2)
         draw_text(
             money_text,
             money_x,
             layout.cash_y + 6,
             font_size,
-            Color(230, 230, 230, 255),
+            _TEXT_COLOR,
         )
 
-        # Vent Heat button (RE: "-{ventAmount} Heat (-{ventRate} per tick)")
-        vent_amt = format_number_with_suffix(sim.manual_vent_amount, max_decimals=2)
-        vent_rate = format_number_with_suffix(sim.auto_vent_rate_per_tick(), max_decimals=2)
-        vent_cap = format_number_with_suffix(sim.preview_active_dissipation, max_decimals=3)
-        label = f"-{vent_amt} Heat (cap {vent_cap}/t)"
+        # Vent Heat button (RE: "-{ventAmount} Heat (-{ventRate} per tick)";
+        # the rate slot shows the active dissipation cap here instead)
         bx, by = layout.vent_x, layout.vent_y
-        tex = self.button_base
-        if pressed_vent and self.button_pressed is not None:
-            tex = self.button_pressed
-        elif hover_vent and self.button_hover is not None:
-            tex = self.button_hover
+        tex = _button_texture(
+            self.button_base, self.button_hover, self.button_pressed, hover_vent, pressed_vent)
 
         if tex is not None:
-            draw_texture_ex(tex, Vector2(bx, by), 0.0, 1.0, Color(255, 255, 255, 255))
+            draw_texture_ex(tex, _v2(bx, by), 0.0, 1.0, _WHITE)
             btn_w = tex.width
             btn_h = tex.height
             btn_text_w = tex.width - 20
         else:
             btn_w = 220
             btn_h = 28
-            draw_rectangle(bx, by, btn_w, btn_h, Color(60, 60, 70, 255))
+            draw_rectangle(bx, by, btn_w, btn_h, _BUTTON_FALLBACK_COLOR)
             btn_text_w = 204
-        vent_font = _fit_font_size(label, btn_text_w, 14, min_size=9)
-        vent_text_w = _measure(label, vent_font)
+        key = (sim.manual_vent_amount, sim.preview_active_dissipation, btn_text_w)
+        cached = self._label_memo("vent", key)
+        if cached is None:
+            vent_amt = format_number_with_suffix(sim.manual_vent_amount, max_decimals=2)
+            vent_cap = format_number_with_suffix(sim.preview_active_dissipation, max_decimals=3)
+            label = f"-{vent_amt} Heat (cap {vent_cap}/t)"
+            vent_font = _fit_font_size(label, btn_text_w, 14, min_size=9)
+            cached = (label, vent_font, _measure(label, vent_font))
+            self._label_cache["vent"] = (key, cached)
+        label, vent_font, vent_text_w = cached
         tx = bx + max(0, (btn_w - vent_text_w) // 2)
         ty = by + max(0, (btn_h - vent_font) // 2) - 1
-        draw_text(label, tx, ty, vent_font, Color(240, 240, 240, 255))
+        draw_text(label, tx, ty, vent_font, _BUTTON_LABEL_COLOR)
 
         # Sell All Power / Scrounge button
         # RE: "Sell All Power: +{power} $ (+{autoSellRate} $ per tick)"
         # or "Scrounge for cash (+1$)" when money+power < 10
-        if sim.can_scrounge():
-            label = "Scrounge for cash (+1$)"
-        else:
-            power_str = format_number_with_suffix(sim.stored_power, max_decimals=2)
-            rate_str = format_number_with_suffix(sim.auto_sell_rate_per_tick(), max_decimals=2)
-            label = f"+{power_str}$ (+{rate_str}$/t)"
         bx, by = layout.sell_x, layout.sell_y
-        tex = self.button_base
-        if pressed_sell and self.button_pressed is not None:
-            tex = self.button_pressed
-        elif hover_sell and self.button_hover is not None:
-            tex = self.button_hover
+        tex = _button_texture(
+            self.button_base, self.button_hover, self.button_pressed, hover_sell, pressed_sell)
 
         if tex is not None:
-            draw_texture_ex(tex, Vector2(bx, by), 0.0, 1.0, Color(255, 255, 255, 255))
+            draw_texture_ex(tex, _v2(bx, by), 0.0, 1.0, _WHITE)
             btn_w = tex.width
             btn_h = tex.height
             btn_text_w = tex.width - 20
         else:
             btn_w = 320
             btn_h = 28
-            draw_rectangle(bx, by, btn_w, btn_h, Color(60, 60, 70, 255))
+            draw_rectangle(bx, by, btn_w, btn_h, _BUTTON_FALLBACK_COLOR)
             btn_text_w = 304
-        sell_font = _fit_font_size(label, btn_text_w, 14, min_size=9)
-        sell_text_w = _measure(label, sell_font)
+        scrounge = sim.can_scrounge()
+        sell_rate = 0.0 if scrounge else sim.auto_sell_rate_per_tick()
+        key = (scrounge, sim.stored_power, sell_rate, btn_text_w)
+        cached = self._label_memo("sell", key)
+        if cached is None:
+            if scrounge:
+                label = "Scrounge for cash (+1$)"
+            else:
+                power_str = format_number_with_suffix(sim.stored_power, max_decimals=2)
+                rate_str = format_number_with_suffix(sell_rate, max_decimals=2)
+                label = f"+{power_str}$ (+{rate_str}$/t)"
+            sell_font = _fit_font_size(label, btn_text_w, 14, min_size=9)
+            cached = (label, sell_font, _measure(label, sell_font))
+            self._label_cache["sell"] = (key, cached)
+        label, sell_font, sell_text_w = cached
         tx = bx + max(0, (btn_w - sell_text_w) // 2)
         ty = by + max(0, (btn_h - sell_font) // 2) - 1
-        draw_text(label, tx, ty, sell_font, Color(240, 240, 240, 255))
+        draw_text(label, tx, ty, sell_font, _BUTTON_LABEL_COLOR)
 
         # Stats panel is hidden until we wire the real stats page UI.
         new_selected, hovered = self.draw_store(sim, layout, mouse_x, mouse_y, mouse_pressed)
@@ -268,18 +407,18 @@ class Ui:
                 hovered = x <= mouse_x <= x + slot_w and y <= mouse_y <= y + slot_h
                 selected = idx == sim.shop_page
                 locked = sim.shop_page_locked(idx)
-                tex = base
-                if selected and pressed is not None and not locked:
-                    tex = pressed
-                elif hovered and hover is not None and not locked:
-                    tex = hover
-                tint = Color(160, 160, 160, 255) if locked else Color(255, 255, 255, 255)
-                draw_texture_ex(tex, Vector2(x, y), 0.0, 1.0, tint)
+                tex = _button_texture(
+                    base, hover, pressed, hovered and not locked, selected and not locked)
+                tint = _LOCKED_TINT if locked else _WHITE
+                draw_texture_ex(tex, _v2(x, y), 0.0, 1.0, tint)
                 if hovered and mouse_pressed and not locked:
                     if sim.shop_page != idx:
                         sim.selected_component_index = -1
                     sim.shop_page = idx
 
+        # A collapsed store area has no item slots to hover or click.
+        if layout.store_area_w <= 0 or layout.store_area_h <= 0:
+            return None, None
         shop_components = sim.shop_components_for_page()
         if not shop_components:
             return None, None
@@ -287,24 +426,45 @@ class Ui:
         selected_index = None
         hovered_component = None
         slots = self.store_item_slots(layout, shop_components)
-        for idx, (comp, rect) in enumerate(slots):
-            x, y, slot_w, slot_h = rect
-            hovered = x <= mouse_x <= x + slot_w and y <= mouse_y <= y + slot_h
-
-            if comp.sprite_name:
-                # Icon drawing happens in main for consistency with texture cache.
-                pass
-
-            if hovered:
-                hovered_component = comp
+        # Skip the per-slot hit test when the cursor is outside every slot
+        # (the usual case: it is over the reactor grid or a panel).
+        bounds, comps, edges = self._item_slots_hit_data(slots)
+        x0, y0, x1, y1 = bounds
+        if not (x0 <= mouse_x <= x1 and y0 <= mouse_y <= y1):
+            return None, None
+        # Icon drawing happens in main for consistency with texture cache.
+        money = sim.store.money
+        for idx, (x0, y0, x1, y1) in enumerate(edges):
+            if not (x0 <= mouse_x <= x1 and y0 <= mouse_y <= y1):
+                continue
+            comp = comps[idx]
+            hovered_component = comp
             # RE: unnamed_function_10560 (line 396749) — only selectable
             # if cost <= money
-            if hovered and mouse_pressed and comp.cost <= sim.store.money:
+            if mouse_pressed and comp.cost <= money:
                 selected_index = idx
 
         return selected_index, hovered_component
 
+    @staticmethod
+    def _store_geometry(layout: Layout) -> tuple:
+        return (
+            layout.store_area_x, layout.store_area_y, layout.store_area_w, layout.store_area_h,
+            layout.store_tab_offset_y, layout.store_row_h, layout.store_sep_h,
+        )
+
     def store_tab_slots(self, layout: Layout) -> list[tuple[int, int, int, int]]:
+        # Geometry only moves when the layout does; reuse the last result.
+        key = self._store_geometry(layout)
+        cached = self._tab_slots_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        slots = self._compute_store_tab_slots(layout)
+        self._tab_slots_cache = (key, slots)
+        return slots
+
+    @staticmethod
+    def _compute_store_tab_slots(layout: Layout) -> list[tuple[int, int, int, int]]:
         if layout.store_area_w <= 0 or layout.store_area_h <= 0:
             return []
         slot_w = 30
@@ -321,6 +481,44 @@ class Ui:
 
     def store_item_slots(
         self, layout: Layout, components: list[ComponentTypeStats]
+    ) -> list[tuple[ComponentTypeStats, tuple[int, int, int, int]]]:
+        # shop_components_for_page hands back the same list until the page or
+        # upgrades change, so identity plus geometry identifies the result.
+        # Holding the list in the key keeps its id from being reused.
+        key = self._store_geometry(layout)
+        cached = self._item_slots_cache
+        if cached is not None and cached[1] is components and cached[0] == key:
+            return cached[2]
+        slots = self._compute_store_item_slots(layout, components)
+        self._item_slots_cache = (key, components, slots)
+        self._item_slots_hit = None
+        return slots
+
+    def _item_slots_hit_data(
+        self, slots: list[tuple[ComponentTypeStats, tuple[int, int, int, int]]]
+    ) -> tuple[tuple[int, int, int, int], list[ComponentTypeStats], list[tuple[int, int, int, int]]]:
+        """Hit-test view of the cached item slots: the inclusive (x0, y0, x1, y1)
+        box around all of them, their components, and each slot's edges."""
+        cached = self._item_slots_hit
+        if cached is not None and cached[0] is slots:
+            return cached[1:]
+        comps = [comp for comp, _rect in slots]
+        edges = [(x, y, x + w, y + h) for _comp, (x, y, w, h) in slots]
+        if edges:
+            bounds = (
+                min(e[0] for e in edges),
+                min(e[1] for e in edges),
+                max(e[2] for e in edges),
+                max(e[3] for e in edges),
+            )
+        else:
+            bounds = (0, 0, -1, -1)
+        self._item_slots_hit = (slots, bounds, comps, edges)
+        return bounds, comps, edges
+
+    @staticmethod
+    def _compute_store_item_slots(
+        layout: Layout, components: list[ComponentTypeStats]
     ) -> list[tuple[ComponentTypeStats, tuple[int, int, int, int]]]:
         if not components:
             return []
@@ -366,6 +564,8 @@ class Ui:
         panel_y = layout.top_panel_y
         panel_w = layout.top_panel_w
         panel_h = layout.top_panel_h
+        if not _rect_on_screen(layout, panel_x, panel_y, panel_w, panel_h):
+            return
         margin = 14
         font_sm = 12
         font_title = 14
@@ -374,10 +574,10 @@ class Ui:
         if self.top_banner is not None:
             draw_texture_ex(
                 self.top_banner,
-                Vector2(panel_x, panel_y),
+                _v2(panel_x, panel_y),
                 0.0,
                 1.0,
-                Color(255, 255, 255, 255),
+                _WHITE,
             )
 
         comp = sim.hover_component
@@ -385,7 +585,7 @@ class Ui:
             return
 
         placed = sim.hover_placed_component
-        text_color = Color(230, 230, 230, 255)
+        text_color = _TEXT_COLOR
 
         # Determine which corner slots are active (fuel cells on grid only)
         has_per_tick = (
@@ -408,30 +608,29 @@ class Ui:
             hw = _measure(hpt, font_sm)
             draw_text(hpt, right_edge - hw, top_row_y, font_sm, text_color)
 
+        # Title and description only change with the hovered type, depletion
+        # and upgrade state; reuse their layout while the hover holds still.
+        depleted = placed is not None and placed.depleted
+        mgr = sim.upgrade_manager
+        info_key = (
+            comp, depleted, panel_x, panel_y, right_edge,
+            mgr, mgr.version, sim.depleted_protium_count,
+            sim.self_vent_mult, sim.heat_exchange_mult,
+        )
+        info = self._info_cache
+        if info is None or info[0] != info_key:
+            info = (info_key, *self._layout_component_info(
+                comp, sim, depleted, panel_x, panel_y, right_edge, margin, font_sm, font_title))
+            self._info_cache = info
+        _, title_draw, desc_draws, y = info
+        # Usable width stops before the pause/replace buttons
+        desc_max_w = right_edge - panel_x - margin
+
         # ── Slot 0: Title — centered ──
-        title = comp.display_name or comp.name
-        if placed is not None and placed.depleted:
-            title = f"Depleted {title}"
-        # Center within the area left of pause/replace buttons
-        usable_w = right_edge - panel_x - margin
-        title_w = _measure(title, font_title)
-        title_x = panel_x + max(0, (usable_w - title_w) // 2 + margin)
-        title_y = panel_y + 12
-        draw_text(title, title_x, title_y, font_title, text_color)
+        draw_text(*title_draw, text_color)
 
         # ── Slot 1: Description — centered, wrapped, below title ──
-        description = _format_component_description(comp, sim)
-        if placed is not None and placed.depleted:
-            description = "This cell has run out of fuel and is now inert. Right-click to remove it."
-        # Usable width stops before the pause/replace buttons
-        desc_max_w = right_edge - panel_x - margin
-        desc_lines = _wrap_text(description, desc_max_w, font_sm) if description else []
-        y = title_y + 20
-        for line in desc_lines:
-            line_w = _measure(line, font_sm)
-            line_x = panel_x + max(0, (desc_max_w - line_w) // 2 + margin)
-            draw_text(line, line_x, y, font_sm, text_color)
-            y += 14
+        draw_text_batch(desc_draws, text_color)
 
         # Throughput warning: outlets are the bottleneck relative to vent capacity.
         show_outlet_warning = (
@@ -444,16 +643,18 @@ class Ui:
                 "Warning icon: this outlet is a throughput bottleneck for an adjacent vent."
             )
             warning_font = 11
-            warning_color = Color(255, 220, 90, 255)
+            warning_color = _WARNING_COLOR
             icon_x = panel_x + margin
             icon_y = y + 2
             self.draw_warning_badge(icon_x, icon_y, size=10)
 
             wy = y
             warn_lines = _wrap_text(warning_text, max(20, desc_max_w - 18), warning_font)
+            warn_draws = []
             for line in warn_lines:
-                draw_text(line, icon_x + 14, wy, warning_font, warning_color)
+                warn_draws.append((line, icon_x + 14, wy, warning_font))
                 wy += 13
+            draw_text_batch(warn_draws, warning_color)
 
         # ── Slot 2: Cost / Sells for — bottom-left ──
         if placed is not None:
@@ -491,6 +692,35 @@ class Ui:
                     text_color,
                 )
 
+    @staticmethod
+    def _layout_component_info(
+        comp: ComponentTypeStats, sim: Simulation, depleted: bool,
+        panel_x: int, panel_y: int, right_edge: int, margin: int, font_sm: int, font_title: int,
+    ) -> tuple[tuple, list, int]:
+        """Return (title draw, description draws, y below description) for the info banner."""
+        title = comp.display_name or comp.name
+        if depleted:
+            title = f"Depleted {title}"
+        # Center within the area left of pause/replace buttons
+        usable_w = right_edge - panel_x - margin
+        title_w = _measure(title, font_title)
+        title_x = panel_x + max(0, (usable_w - title_w) // 2 + margin)
+        title_y = panel_y + 12
+
+        description = _format_component_description(comp, sim)
+        if depleted:
+            description = "This cell has run out of fuel and is now inert. Right-click to remove it."
+        desc_max_w = right_edge - panel_x - margin
+        desc_lines = _wrap_text(description, desc_max_w, font_sm) if description else ()
+        y = title_y + 20
+        desc_draws = []
+        for line in desc_lines:
+            line_w = _measure(line, font_sm)
+            line_x = panel_x + max(0, (desc_max_w - line_w) // 2 + margin)
+            desc_draws.append((line, line_x, y, font_sm))
+            y += 14
+        return (title, title_x, title_y, font_title), desc_draws, y
+
     def draw_upgrade_grid(
         self,
         sim: Simulation,
@@ -525,15 +755,20 @@ class Ui:
 
         hovered_upgrade: Optional[UpgradeType] = None
 
-        for u in mgr.upgrades:
-            if u.index not in positions:
-                continue
-            row, col = positions[u.index]
-            x = ox + col * (cell_w + gap)
-            y = oy + row * (cell_h + gap)
+        # Loop invariants; money/EP are re-read only after a purchase.
+        pitch_w = cell_w + gap
+        pitch_h = cell_h + gap
+        store = sim.store
+        money = store.money
+        exotic = store.exotic_particles
+        sprites = self.upgrade_sprites
+
+        for u, row, col, icon_tex, cat_tex in self._upgrade_cells(positions, sprites, mgr.upgrades):
+            x = ox + col * pitch_w
+            y = oy + row * pitch_h
 
             is_hover = x <= mouse_x <= x + cell_w and y <= mouse_y <= y + cell_h
-            can_buy = mgr.can_purchase(u.index, sim.store.money, sim.store.exotic_particles)
+            can_buy = mgr.can_purchase(u.index, money, exotic)
             is_one_time_owned = u.cost_multiplier == 0.0 and u.level > 0
 
             # Pick background texture — no lock button, use dimmed tint instead
@@ -546,21 +781,18 @@ class Ui:
 
             # Bright if purchasable, dim otherwise
             if can_buy:
-                tint = Color(255, 255, 255, 255)
+                tint = _WHITE
             else:
-                tint = Color(160, 160, 160, 255)
+                tint = _LOCKED_TINT
 
             if tex is not None:
-                draw_texture_ex(tex, Vector2(x, y), 0.0, 1.0, tint)
+                draw_texture_ex(tex, _v2(x, y), 0.0, 1.0, tint)
             else:
-                bg_color = Color(40, 50, 70, 255) if can_buy else Color(30, 30, 40, 255)
-                draw_rectangle(x, y, cell_w, cell_h, bg_color)
-                draw_rectangle_lines(x, y, cell_w, cell_h, Color(80, 90, 110, 255))
+                bg_color = _UPGRADE_BG_COLOR if can_buy else _UPGRADE_BG_LOCKED_COLOR
+                draw_rectangle_bordered(x, y, cell_w, cell_h, bg_color, _UPGRADE_BORDER_COLOR)
 
             # Draw upgrade icon sprite centered on button
-            sprites = self.upgrade_sprites
             if sprites:
-                icon_tex = sprites.get(u.icon)
                 if icon_tex is not None:
                     # Scale to fit within button with margin
                     margin = 8
@@ -573,22 +805,21 @@ class Ui:
                     iy = y + (cell_h - dh) / 2
                     draw_texture_pro(
                         icon_tex,
-                        Rectangle(0, 0, icon_tex.width, icon_tex.height),
+                        texture_source_rect(icon_tex),
                         Rectangle(ix, iy, dw, dh),
-                        Vector2(0, 0), 0.0, tint,
+                        _ORIGIN, 0.0, tint,
                     )
 
                 # Category overlay in bottom-right corner
-                cat_tex = sprites.get(u.category)
                 if cat_tex is not None:
                     cx = x + cell_w - cat_tex.width - 2
                     cy = y + cell_h - cat_tex.height - 2
-                    draw_texture_ex(cat_tex, Vector2(cx, cy), 0.0, 1.0, Color(255, 255, 255, 255))
+                    draw_texture_ex(cat_tex, _v2(cx, cy), 0.0, 1.0, _WHITE)
 
             # Level indicator (bottom-left corner, above category overlay)
             if u.level > 0:
                 lvl_text = str(u.level)
-                draw_text(lvl_text, x + 4, y + cell_h - 14, 10, Color(200, 255, 200, 255))
+                draw_text(lvl_text, x + 4, y + cell_h - 14, 10, _UPGRADE_LEVEL_COLOR)
 
             # Hover tracking
             if is_hover:
@@ -596,9 +827,11 @@ class Ui:
 
             # Click to purchase
             if is_hover and mouse_pressed and can_buy:
-                sim.store.money, sim.store.exotic_particles = mgr.purchase(
-                    u.index, sim.store.money, sim.store.exotic_particles
+                store.money, store.exotic_particles = mgr.purchase(
+                    u.index, store.money, store.exotic_particles
                 )
+                money = store.money
+                exotic = store.exotic_particles
                 sim.recompute_max_capacities()
                 # Subspace Expansion (upgrade 50): resize grid on purchase
                 if u.index == 50:
@@ -609,6 +842,32 @@ class Ui:
         # upgrade/prestige views.
         self._draw_upgrade_panel(sim, layout, hovered_upgrade)
 
+    def _upgrade_cells(
+        self, positions: Mapping[int, tuple[int, int]], sprites: Optional[dict],
+        upgrades: list[UpgradeType],
+    ) -> list[tuple[UpgradeType, int, int, Optional[Texture2D], Optional[Texture2D]]]:
+        """(upgrade, row, col, icon, category) for each upgrade shown in a grid.
+
+        Upgrades without a grid position are dropped and textures resolved
+        once per positions table / sprite table / upgrade list, instead of
+        three dict lookups per upgrade per frame.
+        """
+        cached = self._upgrade_cells_cache.get(id(positions))
+        if (
+            cached is not None and cached[0] is sprites and cached[1] is upgrades
+            and cached[2] == len(upgrades)
+        ):
+            return cached[3]
+        table = sprites or {}
+        cells = []
+        for u in upgrades:
+            pos = positions.get(u.index)
+            if pos is None:
+                continue
+            cells.append((u, pos[0], pos[1], table.get(u.icon), table.get(u.category)))
+        self._upgrade_cells_cache[id(positions)] = (sprites, upgrades, len(upgrades), cells)
+        return cells
+
     def _draw_upgrade_panel(self, sim: Simulation, layout: Layout, u: UpgradeType | None) -> None:
         """Draw top banner panel for upgrade/prestige views.
 
@@ -619,6 +878,8 @@ class Ui:
         panel_y = layout.top_panel_y
         panel_w = layout.top_panel_w
         panel_h = layout.top_panel_h
+        if not _rect_on_screen(layout, panel_x, panel_y, panel_w, panel_h):
+            return
         margin = 14
         font_sm = 12
         font_title = 14
@@ -627,36 +888,43 @@ class Ui:
         if self.top_banner is not None:
             draw_texture_ex(
                 self.top_banner,
-                Vector2(panel_x, panel_y),
+                _v2(panel_x, panel_y),
                 0.0,
                 1.0,
-                Color(255, 255, 255, 255),
+                _WHITE,
             )
 
         if u is None:
             return
 
         mgr = sim.upgrade_manager
-        text_color = Color(230, 230, 230, 255)
+        text_color = _TEXT_COLOR
 
         # Title — constrained to avoid overlapping pause/replace buttons
         right_edge = layout.pause_x - margin
         usable_w = right_edge - panel_x - margin
-        title = mgr.display_name(u.index)
-        if u.level > 0 and u.cost_multiplier != 0.0:
-            title = f"{title} (Lv. {u.level})"
-        title_w = _measure(title, font_title)
-        title_x = panel_x + max(0, (usable_w - title_w) // 2 + margin)
-        draw_text(title, title_x, panel_y + 8, font_title, text_color)
-
-        # Description
-        desc_lines = _wrap_text(u.description, usable_w, font_sm)
-        y = panel_y + 26
-        for line in desc_lines:
-            line_w = _measure(line, font_sm)
-            line_x = panel_x + max(0, (usable_w - line_w) // 2 + margin)
-            draw_text(line, line_x, y, font_sm, text_color)
-            y += 14
+        info_key = (u, u.level, mgr, panel_x, panel_y, right_edge)
+        info = self._info_cache
+        if info is None or info[0] != info_key:
+            title = mgr.display_name(u.index)
+            if u.level > 0 and u.cost_multiplier != 0.0:
+                title = f"{title} (Lv. {u.level})"
+            title_w = _measure(title, font_title)
+            title_x = panel_x + max(0, (usable_w - title_w) // 2 + margin)
+
+            # Description
+            desc_lines = _wrap_text(u.description, usable_w, font_sm)
+            y = panel_y + 26
+            desc_draws = []
+            for line in desc_lines:
+                line_w = _measure(line, font_sm)
+                line_x = panel_x + max(0, (usable_w - line_w) // 2 + margin)
+                desc_draws.append((line, line_x, y, font_sm))
+                y += 14
+            info = (info_key, (title, title_x, panel_y + 8, font_title), desc_draws, y)
+            self._info_cache = info
+        draw_text(*info[1], text_color)
+        draw_text_batch(info[2], text_color)
 
         # Cost line (bottom-left)
         is_one_time_owned = u.cost_multiplier == 0.0 and u.level > 0
@@ -674,65 +942,74 @@ class Ui:
         panel_y = layout.top_panel_y
         panel_w = layout.top_panel_w
         panel_h = layout.top_panel_h
-        text_color = Color(230, 230, 230, 255)
+        text_color = _TEXT_COLOR
 
-        if self.top_banner is not None:
+        if self.top_banner is not None and _rect_on_screen(layout, panel_x, panel_y, panel_w, panel_h):
             draw_texture_ex(
                 self.top_banner,
-                Vector2(panel_x, panel_y),
+                _v2(panel_x, panel_y),
                 0.0, 1.0,
-                Color(255, 255, 255, 255),
+                _WHITE,
             )
 
         # Content area
         content_x = layout.upgrade_grid_x
         content_y = layout.upgrade_grid_y + 4
         content_w = panel_w - (content_x - panel_x) * 2
+        if content_w <= 0 or content_y >= layout.window_height:
+            return
+
+        # Formatting, fitting and wrapping only redo when a displayed value moves
+        store = sim.store
+        prestige_ep = sim.calculate_prestige_ep()
+        key = (
+            content_x, content_y, content_w,
+            store.money, store.total_money, store.money_earned_this_game,
+            sim.stored_power, store.total_power_produced, store.power_produced_this_game,
+            sim.reactor_heat, store.total_heat_dissipated, store.heat_dissipated_this_game,
+            sim.preview_vent_capacity, sim.preview_outlet_capacity,
+            store.exotic_particles, store.total_exotic_particles, prestige_ep,
+        )
+        if key != self._stats_cache_key:
+            self._stats_cache_key = key
+            self._stats_cache_draws = self._layout_statistics_lines(
+                sim, prestige_ep, content_x, content_y, content_w)
+        draw_text_batch(self._stats_cache_draws, text_color)
+
+    @staticmethod
+    def _layout_statistics_lines(
+        sim: Simulation, prestige_ep: int, content_x: int, content_y: int, content_w: int,
+    ) -> list[tuple[str, int, int, int]]:
+        """Format and position the statistics panel text as (text, x, y, font) entries."""
         font_title = 14
         font_sm = 11
         line_h = 14
+        draws: list[tuple[str, int, int, int]] = []
 
         # Title
         title = "Statistics:"
         tw = _measure(title, font_title)
-        draw_text(title, content_x + (content_w - tw) // 2, content_y, font_title, text_color)
+        draws.append((title, content_x + (content_w - tw) // 2, content_y, font_title))
         y = content_y + 24
 
         # Stat lines
         fmt = format_number_with_suffix
-        lines = [
-            f"Build Version: 1",
-            "",
-            f"Current Money: {fmt(sim.store.money)}",
-            f"Total Money: {fmt(sim.store.total_money)}",
-            f"Money earned this game: {fmt(sim.store.money_earned_this_game)}",
-            "",
-            f"Current Power: {fmt(sim.stored_power)}",
-            f"Total Power produced: {fmt(sim.store.total_power_produced)}",
-            f"Power produced this game: {fmt(sim.store.power_produced_this_game)}",
-            "",
-            f"Current Reactor Heat: {fmt(sim.reactor_heat)}",
-            f"Total Heat dissipated: {fmt(sim.store.total_heat_dissipated)}",
-            f"Heat dissipated this game: {fmt(sim.store.heat_dissipated_this_game)}",
-            f"Vent dissipation cap: {fmt(sim.preview_vent_capacity, max_decimals=4)}/t",
-            f"Outlet transfer cap: {fmt(sim.preview_outlet_capacity, max_decimals=4)}/t",
-            f"Outlet + vent cap: {fmt(sim.preview_vent_capacity + sim.preview_outlet_capacity, max_decimals=4)}/t",
-            "",
-            f"Current Exotic Particles: {fmt(sim.store.exotic_particles)}",
-            f"Total Exotic Particles: {fmt(sim.store.total_exotic_particles)}",
-            f"Exotic Particles earned from next prestige: {fmt(sim.calculate_prestige_ep())}",
-        ]
-
-        for line in lines:
-            if line == "":
+        for row in _STATS_ROWS:
+            if row is None:
                 y += line_h // 2
                 continue
+            label, extract, fmt_kwargs, unit = row
+            if extract is None:
+                line = label
+            else:
+                line = f"{label}{fmt(extract(sim, prestige_ep), **fmt_kwargs)}{unit}"
             line_font = _fit_font_size(line, content_w - 8, font_sm, min_size=9)
             wrapped = _wrap_text(line, content_w - 8, line_font)
             for wline in wrapped:
                 lw = _measure(wline, line_font)
-                draw_text(wline, content_x + (content_w - lw) // 2, y, line_font, text_color)
+                draws.append((wline, content_x + (content_w - lw) // 2, y, line_font))
                 y += line_h
+        return draws
 
     def draw_options_panel(
         self,
@@ -748,15 +1025,7 @@ class Ui:
         panel_y = layout.top_panel_y
         panel_w = layout.top_panel_w
         panel_h = layout.top_panel_h
-        text_color = Color(230, 230, 230, 255)
-
-        if self.top_banner is not None:
-            draw_texture_ex(
-                self.top_banner,
-                Vector2(panel_x, panel_y),
-                0.0, 1.0,
-                Color(255, 255, 255, 255),
-            )
+        text_color = _TEXT_COLOR
 
         content_x = layout.upgrade_grid_x
         content_y = layout.upgrade_grid_y + 4
@@ -770,28 +1039,54 @@ class Ui:
             # Phase C: Refund window (post-prestige, one-shot)
             prestige_label = "Refund prestige upgrades?"
             can_click = True
-            bg_normal = Color(40, 100, 80, 255)
-            bg_hover = Color(60, 130, 100, 255)
-            border_color = Color(70, 140, 110, 255)
+            bg_normal = _PRESTIGE_REFUND_BG
+            bg_hover = _PRESTIGE_REFUND_HOVER
+            border_color = _PRESTIGE_REFUND_BORDER
         elif sim.prestige_confirming:
             # Phase B: Confirmation
             prestige_label = "Click again to confirm (Will restart game)"
             can_click = True
-            bg_normal = Color(140, 90, 30, 255)
-            bg_hover = Color(180, 110, 40, 255)
-            border_color = Color(190, 130, 50, 255)
+            bg_normal = _PRESTIGE_CONFIRM_BG
+            bg_hover = _PRESTIGE_CONFIRM_HOVER
+            border_color = _PRESTIGE_CONFIRM_BORDER
         else:
             # Phase A: Normal
             ep_gain = sim.calculate_prestige_ep()
             prestige_label = f"Prestige for {format_number_with_suffix(ep_gain)} exotic particles."
             can_click = True
-            bg_normal = Color(70, 50, 100, 255)
-            bg_hover = Color(100, 70, 140, 255)
-            border_color = Color(100, 80, 130, 255)
+            bg_normal = _PRESTIGE_BG
+            bg_hover = _PRESTIGE_HOVER
+            border_color = _PRESTIGE_BORDER
+
+        # With no click and no reset countdown running, nothing below has side
+        # effects or changes unless the cursor moves, so idle frames replay the
+        # previous frame's draw calls.
+        idle = not mouse_pressed and sim.reset_confirm_timer <= 0
+        frame_key = (
+            prestige_label, mouse_x, mouse_y, panel_x, panel_y, panel_w,
+            content_x, content_y, self.top_banner, self.save_dir is not None,
+        )
+        cached = self._options_draws_cache
+        if idle and cached is not None and cached[0] == frame_key:
+            for draw, args in cached[1]:
+                draw(*args)
+            return
 
-        pbtn_w = _measure(prestige_label, font_sm) + 24
+        draws: list = []
+        if self.top_banner is not None:
+            draws.append((draw_texture_ex, (self.top_banner, Vector2(panel_x, panel_y), 0.0, 1.0, _WHITE)))
+
+        # Button geometry only moves with the label text or the content area
+        key = (prestige_label, content_x, content_w)
+        cached = self._label_memo("prestige", key)
+        if cached is None:
+            plw = _measure(prestige_label, font_sm)
+            pbtn_w = plw + 24
+            pbtn_x = content_x + (content_w - pbtn_w) // 2
+            cached = (pbtn_x, pbtn_w, pbtn_x + (pbtn_w - plw) // 2)
+            self._label_cache["prestige"] = (key, cached)
+        pbtn_x, pbtn_w, plabel_x = cached
         pbtn_h = 26
-        pbtn_x = content_x + (content_w - pbtn_w) // 2
         pbtn_y = content_y
 
         hover_prestige_btn = (pbtn_x <= mouse_x <= pbtn_x + pbtn_w and
@@ -802,12 +1097,10 @@ class Ui:
         elif can_click:
             pbg = bg_normal
         else:
-            pbg = Color(40, 35, 50, 255)
-        draw_rectangle(pbtn_x, pbtn_y, pbtn_w, pbtn_h, pbg)
-        draw_rectangle_lines(pbtn_x, pbtn_y, pbtn_w, pbtn_h, border_color)
-        plw = _measure(prestige_label, font_sm)
-        ptint = text_color if can_click else Color(140, 140, 140, 255)
-        draw_text(prestige_label, pbtn_x + (pbtn_w - plw) // 2, pbtn_y + 7, font_sm, ptint)
+            pbg = _PRESTIGE_DISABLED_BG
+        draws.append((draw_rectangle_bordered, (pbtn_x, pbtn_y, pbtn_w, pbtn_h, pbg, border_color)))
+        ptint = text_color if can_click else _PRESTIGE_DISABLED_TEXT
+        draws.append((draw_text, (prestige_label, plabel_x, pbtn_y + 7, font_sm, ptint)))
 
         if hover_prestige_btn and mouse_pressed and can_click:
             if sim.prestige_can_refund:
@@ -817,17 +1110,24 @@ class Ui:
             else:
                 sim.prestige_confirming = True
 
-        y = content_y + 34
-        desc = (
-            "When you 'prestige', you will lose all components, money, power, heat, and upgrades. "
-            "In exchange, you'll get exotic particles, which will let you get powerful, permanent "
-            "upgrades. It is recommended you wait until you can get 51 particles before your first prestige."
-        )
-        desc_lines = _wrap_text(desc, content_w, font_sm)
-        for line in desc_lines:
-            lw = _measure(line, font_sm)
-            draw_text(line, content_x + (content_w - lw) // 2, y, font_sm, text_color)
-            y += line_h
+        key = (content_x, content_y, content_w)
+        cached = self._label_memo("options_desc", key)
+        if cached is None:
+            y = content_y + 34
+            desc = (
+                "When you 'prestige', you will lose all components, money, power, heat, and upgrades. "
+                "In exchange, you'll get exotic particles, which will let you get powerful, permanent "
+                "upgrades. It is recommended you wait until you can get 51 particles before your first prestige."
+            )
+            desc_lines = _wrap_text(desc, content_w, font_sm)
+            desc_draws = []
+            for line in desc_lines:
+                desc_draws.append((line, content_x + _center_offset(line, font_sm, content_w), y, font_sm))
+                y += line_h
+            cached = (desc_draws, y)
+            self._label_cache["options_desc"] = (key, cached)
+        desc_draws, y = cached
+        draws.append((draw_text_batch, (desc_draws, text_color)))
 
         # Reset Game button
         y += line_h
@@ -854,16 +1154,14 @@ class Ui:
 
         # Draw button
         if sim.reset_confirm_timer > 0:
-            bg_color = Color(180, 50, 50, 255) if hover_reset else Color(140, 40, 40, 255)
+            bg_color = _RESET_CONFIRM_HOVER if hover_reset else _RESET_CONFIRM_BG
             label = "Click again to confirm"
         else:
-            bg_color = Color(80, 40, 40, 255) if hover_reset else Color(60, 30, 30, 255)
+            bg_color = _RESET_HOVER if hover_reset else _RESET_BG
             label = "Reset Game"
 
-        draw_rectangle(btn_x, btn_y, btn_w, btn_h, bg_color)
-        draw_rectangle_lines(btn_x, btn_y, btn_w, btn_h, Color(120, 60, 60, 255))
-        lw = _measure(label, font_sm)
-        draw_text(label, btn_x + (btn_w - lw) // 2, btn_y + 7, font_sm, text_color)
+        draws.append((draw_rectangle_bordered, (btn_x, btn_y, btn_w, btn_h, bg_color, _RESET_BORDER)))
+        draws.append((draw_text, (label, btn_x + _center_offset(label, font_sm, btn_w), btn_y + 7, font_sm, text_color)))
 
         # ── Export / Import buttons ──────────────────────────────────
         if self.save_dir is not None:
@@ -875,16 +1173,15 @@ class Ui:
             gap = 10
             total_w = ei_btn_w * 2 + gap
             ei_start_x = content_x + (content_w - total_w) // 2
+            # Both export buttons share one row; test the cursor's y once.
+            in_ei_row = ei_y <= mouse_y <= ei_y + ei_btn_h
 
             # Export Old button
             old_x = ei_start_x
-            hover_old = (old_x <= mouse_x <= old_x + ei_btn_w and
-                         ei_y <= mouse_y <= ei_y + ei_btn_h)
-            old_bg = Color(60, 80, 60, 255) if hover_old else Color(40, 60, 40, 255)
-            draw_rectangle(old_x, ei_y, ei_btn_w, ei_btn_h, old_bg)
-            draw_rectangle_lines(old_x, ei_y, ei_btn_w, ei_btn_h, Color(80, 120, 80, 255))
-            old_lw = _measure("Export Old", font_sm)
-            draw_text("Export Old", old_x + (ei_btn_w - old_lw) // 2, ei_y + 7, font_sm, text_color)
+            hover_old = in_ei_row and old_x <= mouse_x <= old_x + ei_btn_w
+            old_bg = _EXPORT_OLD_HOVER if hover_old else _EXPORT_OLD_BG
+            draws.append((draw_rectangle_bordered, (old_x, ei_y, ei_btn_w, ei_btn_h, old_bg, _EXPORT_OLD_BORDER)))
+            draws.append((draw_text, ("Export Old", old_x + _center_offset("Export Old", font_sm, ei_btn_w), ei_y + 7, font_sm, text_color)))
 
             if hover_old and mouse_pressed:
                 if _WEB:
@@ -894,13 +1191,10 @@ class Ui:
 
             # Export New button
             new_x = ei_start_x + ei_btn_w + gap
-            hover_new = (new_x <= mouse_x <= new_x + ei_btn_w and
-                         ei_y <= mouse_y <= ei_y + ei_btn_h)
-            new_bg = Color(50, 80, 90, 255) if hover_new else Color(35, 60, 70, 255)
-            draw_rectangle(new_x, ei_y, ei_btn_w, ei_btn_h, new_bg)
-            draw_rectangle_lines(new_x, ei_y, ei_btn_w, ei_btn_h, Color(70, 110, 125, 255))
-            new_lw = _measure("Export New", font_sm)
-            draw_text("Export New", new_x + (ei_btn_w - new_lw) // 2, ei_y + 7, font_sm, text_color)
+            hover_new = in_ei_row and new_x <= mouse_x <= new_x + ei_btn_w
+            new_bg = _EXPORT_NEW_HOVER if hover_new else _EXPORT_NEW_BG
+            draws.append((draw_rectangle_bordered, (new_x, ei_y, ei_btn_w, ei_btn_h, new_bg, _EXPORT_NEW_BORDER)))
+            draws.append((draw_text, ("Export New", new_x + _center_offset("Export New", font_sm, ei_btn_w), ei_y + 7, font_sm, text_color)))
 
             if hover_new and mouse_pressed:
                 if _WEB:
@@ -913,38 +1207,185 @@ class Ui:
             im_x = content_x + (content_w - ei_btn_w) // 2
             hover_import = (im_x <= mouse_x <= im_x + ei_btn_w and
                             im_y <= mouse_y <= im_y + ei_btn_h)
-            im_bg = Color(50, 60, 80, 255) if hover_import else Color(35, 45, 60, 255)
-            draw_rectangle(im_x, im_y, ei_btn_w, ei_btn_h, im_bg)
-            draw_rectangle_lines(im_x, im_y, ei_btn_w, ei_btn_h, Color(70, 90, 120, 255))
-            im_lw = _measure("Import", font_sm)
-            draw_text("Import", im_x + (ei_btn_w - im_lw) // 2, im_y + 7, font_sm, text_color)
+            im_bg = _IMPORT_HOVER if hover_import else _IMPORT_BG
+            draws.append((draw_rectangle_bordered, (im_x, im_y, ei_btn_w, ei_btn_h, im_bg, _IMPORT_BORDER)))
+            draws.append((draw_text, ("Import", im_x + _center_offset("Import", font_sm, ei_btn_w), im_y + 7, font_sm, text_color)))
 
             if hover_import and mouse_pressed:
                 import_save_from_file(sim)
 
+        for draw, args in draws:
+            draw(*args)
+        self._options_draws_cache = (frame_key, draws) if idle else None
+
+    def _sprite_fit(self, sprite_name: str, box: int) -> Optional[tuple]:
+        """(texture, draw w, draw h, x offset, y offset) fitting a component
+        sprite into a box-sized square, or None if the sprite is not loaded."""
+        sprites = self.component_sprites
+        cached = self._sprite_fit_cache
+        if cached is None or cached[0] is not sprites:
+            cached = (sprites, {})
+            self._sprite_fit_cache = cached
+        fits = cached[1]
+        key = (sprite_name, box)
+        if key in fits:
+            return fits[key]
+        tex = sprites.get(sprite_name) if sprites else None
+        if tex is None:
+            fit = None
+        else:
+            sc = box / max(1, max(tex.width, tex.height))
+            dw = tex.width * sc
+            dh = tex.height * sc
+            fit = (tex, dw, dh, (box - dw) * 0.5, (box - dh) * 0.5)
+        fits[key] = fit
+        return fit
+
+    def _help_body_draws(self, scroll_y: int, content_x: int, content_y: int, content_w: int, content_h: int) -> list:
+        """(draw function, args) calls that render the help items visible at scroll_y."""
+        draws = []
+        text_color = _HELP_TEXT_COLOR
+        columns = _help_columns(content_w)
+        bottom = scroll_y + content_h
+
+        def _visible(tag: int) -> tuple[list[float], list[tuple]]:
+            # Exact for fixed-height kinds; grids and rows re-check their own height.
+            ys, data, reach = columns[tag]
+            first = bisect.bisect_left(ys, scroll_y - reach)
+            last = bisect.bisect_right(ys, bottom)
+            return ys[first:last], data[first:last]
+
+        ys, data = _visible(_HELP_HEADER)
+        if ys:
+            draws.append((draw_text_batch, (
+                [(text, content_x + 4, int(y - scroll_y + content_y), 16) for y, (text,) in zip(ys, data)],
+                _GOLD_COLOR,
+            )))
+
+        ys, data = _visible(_HELP_TEXT)
+        if ys:
+            draws.append((draw_text_batch, (
+                [(text, content_x + 4, int(y - scroll_y + content_y), 12) for y, (text,) in zip(ys, data)],
+                text_color,
+            )))
+
+        ys, data = _visible(_HELP_SPRITE_LINE)
+        sprite_size = 24
+        quads = []
+        line_draws = []
+        for y, (sprite_name, text) in zip(ys, data):
+            item_y = y - scroll_y + content_y
+            fit = self._sprite_fit(sprite_name, sprite_size)
+            text_x_offset = sprite_size + 6
+            if fit is not None:
+                tex, dw, dh, _ox, _oy = fit
+                quads.append((
+                    tex,
+                    texture_source_rect(tex),
+                    Rectangle(content_x + 4, item_y + 1, dw, dh),
+                ))
+            else:
+                text_x_offset = 4
+            # Wrapped text lines to the right of the sprite
+            ly = item_y + 2
+            for line in _wrap_text(text, content_w - text_x_offset - 8, 12):
+                line_draws.append((line, content_x + text_x_offset, int(ly), 12))
+                ly += 14
+        if quads:
+            draws.append((draw_texture_batch, (quads, _WHITE)))
+        if line_draws:
+            draws.append((draw_text_batch, (line_draws, text_color)))
+
+        quads = []
+        cell = 26
+        gap = 2
+        for y, (rows, height) in zip(*_visible(_HELP_GRID)):
+            if y + height < scroll_y:
+                continue
+            cy0 = int(y - scroll_y + content_y)
+            grid_w = len(rows[0]) * (cell + gap) - gap if rows else 0
+            gx_start = content_x + (content_w - grid_w) // 2
+            for ri, row in enumerate(rows):
+                for ci, sname in enumerate(row):
+                    if sname is None:
+                        continue
+                    fit = self._sprite_fit(sname, cell)
+                    if fit is None:
+                        continue
+                    tex, dw, dh, ox, oy = fit
+                    cx = gx_start + ci * (cell + gap)
+                    cy = cy0 + ri * (cell + gap)
+                    quads.append((
+                        tex,
+                        texture_source_rect(tex),
+                        Rectangle(cx + ox, cy + oy, dw, dh),
+                    ))
+
+        icon_sz = 28
+        gap = 6
+        for y, (sprite_list, height) in zip(*_visible(_HELP_SPRITE_ROW)):
+            if y + height < scroll_y:
+                continue
+            iy = int(y - scroll_y + content_y)
+            total_w = len(sprite_list) * (icon_sz + gap) - gap
+            rx = content_x + (content_w - total_w) // 2
+            for si, sname in enumerate(sprite_list):
+                fit = self._sprite_fit(sname, icon_sz)
+                if fit is None:
+                    continue
+                tex, dw, dh, ox, oy = fit
+                ix = rx + si * (icon_sz + gap)
+                quads.append((
+                    tex,
+                    texture_source_rect(tex),
+                    Rectangle(ix + ox, iy + oy, dw, dh),
+                ))
+        if quads:
+            draws.append((draw_texture_batch, (quads, _WHITE)))
+
+        ys, _ = _visible(_HELP_DIVIDER)
+        for y in ys:
+            draws.append((draw_rectangle, (content_x + 8, int(y - scroll_y + content_y + 3), content_w - 16, 1, _HELP_DIVIDER_COLOR)))
+
+        return draws
+
+    @staticmethod
+    def _help_content_rect(layout: Layout) -> tuple[int, int, int, int]:
+        """Help content region: below the top banner, inside the grid frame."""
+        content_x = layout.upgrade_grid_x
+        content_y = layout.upgrade_grid_y
+        content_w = layout.top_panel_w - (content_x - layout.top_panel_x) * 2
+        content_h = layout.window_height - content_y - (layout.window_height - layout.grid_frame_y - 513)
+        return content_x, content_y, content_w, content_h
+
+    def prepare_help(self, layout: Layout) -> None:
+        """Build and wrap the help content ahead of time so opening the
+        Help view doesn't measure every word on its first frame."""
+        content_w = self._help_content_rect(layout)[2]
+        items, _ = _build_help_content(content_w)
+        for item in items:
+            if item[0] == _HELP_SPRITE_LINE:
+                text_x_offset = 30 if self._sprite_fit(item[2], 24) is not None else 4
+                _wrap_text(item[3], content_w - text_x_offset - 8, 12)
+
     def draw_help_panel(self, sim: Simulation, layout: Layout, wheel_move: float = 0.0, mouse_x: float = 0.0, mouse_y: float = 0.0, mouse_down: bool = False) -> None:
         """Draw a rich, scrollable Help panel in the grid content area."""
         panel_x = layout.top_panel_x
         panel_y = layout.top_panel_y
-        panel_w = layout.top_panel_w
         panel_h = layout.top_panel_h
 
         if self.top_banner is not None:
             draw_texture_ex(
                 self.top_banner,
-                Vector2(panel_x, panel_y),
+                _v2(panel_x, panel_y),
                 0.0, 1.0,
-                Color(255, 255, 255, 255),
+                _WHITE,
             )
 
-        # Content region sits below the top banner, inside the grid frame
-        content_x = layout.upgrade_grid_x
-        content_y = layout.upgrade_grid_y
-        content_w = panel_w - (content_x - panel_x) * 2
-        content_h = layout.window_height - content_y - (layout.window_height - layout.grid_frame_y - 513)
+        content_x, content_y, content_w, content_h = self._help_content_rect(layout)
 
         # Build content items
-        items, total_height = _build_help_content(content_w)
+        _, total_height = _build_help_content(content_w)
 
         # Scroll
         max_scroll = max(0.0, total_height - content_h)
@@ -965,122 +1406,22 @@ class Ui:
             self.help_drag_active = False
 
         self.help_scroll_y = max(0.0, min(self.help_scroll_y, max_scroll))
+        # Keep the float accumulator for smooth drags but draw on whole
+        # pixels, so item positions (and the draw cache) don't drift.
+        scroll_y = int(self.help_scroll_y)
 
         # Render inside scissor region
         begin_scissor_mode(content_x, content_y, content_w, content_h)
 
-        header_color = Color(245, 200, 70, 255)
-        text_color = Color(210, 210, 220, 255)
-        divider_color = Color(80, 80, 100, 180)
-
-        for item in items:
-            tag = item[0]
-            item_y = item[1] - self.help_scroll_y + content_y
-
-            if tag == _HELP_HEADER:
-                _, y_off, text = item
-                if item_y + 20 < content_y or item_y > content_y + content_h:
-                    continue
-                draw_text(text, content_x + 4, int(item_y), 16, header_color)
-
-            elif tag == _HELP_TEXT:
-                _, y_off, text = item
-                if item_y + 14 < content_y or item_y > content_y + content_h:
-                    continue
-                draw_text(text, content_x + 4, int(item_y), 12, text_color)
-
-            elif tag == _HELP_SPRITE_LINE:
-                _, y_off, sprite_name, text = item
-                if item_y + 26 < content_y or item_y > content_y + content_h:
-                    continue
-                sprite_size = 24
-                tex = self.component_sprites.get(sprite_name) if self.component_sprites else None
-                text_x_offset = sprite_size + 6
-                if tex is not None:
-                    scale = sprite_size / max(1, max(tex.width, tex.height))
-                    dw = tex.width * scale
-                    dh = tex.height * scale
-                    sx = content_x + 4
-                    sy = item_y + 1
-                    draw_texture_pro(
-                        tex,
-                        Rectangle(0, 0, tex.width, tex.height),
-                        Rectangle(sx, sy, dw, dh),
-                        Vector2(0, 0), 0.0, Color(255, 255, 255, 255),
-                    )
-                else:
-                    text_x_offset = 4
-                # Draw wrapped text lines to the right of the sprite
-                wrap_w = content_w - text_x_offset - 8
-                lines = _wrap_text(text, wrap_w, 12)
-                ly = item_y + 2
-                for line in lines:
-                    draw_text(line, content_x + text_x_offset, int(ly), 12, text_color)
-                    ly += 14
-
-            elif tag == _HELP_GRID:
-                _, y_off, rows, height = item
-                if item_y + height < content_y or item_y > content_y + content_h:
-                    continue
-                cell = 26
-                gap = 2
-                grid_w = len(rows[0]) * (cell + gap) - gap if rows else 0
-                gx_start = content_x + (content_w - grid_w) // 2
-                sprites = self.component_sprites
-                for ri, row in enumerate(rows):
-                    for ci, sname in enumerate(row):
-                        if sname is None:
-                            continue
-                        tex = sprites.get(sname) if sprites else None
-                        if tex is None:
-                            continue
-                        cx = gx_start + ci * (cell + gap)
-                        cy = int(item_y) + ri * (cell + gap)
-                        sc = cell / max(1, max(tex.width, tex.height))
-                        dw = tex.width * sc
-                        dh = tex.height * sc
-                        ox = (cell - dw) * 0.5
-                        oy = (cell - dh) * 0.5
-                        draw_texture_pro(
-                            tex,
-                            Rectangle(0, 0, tex.width, tex.height),
-                            Rectangle(cx + ox, cy + oy, dw, dh),
-                            Vector2(0, 0), 0.0, Color(255, 255, 255, 255),
-                        )
-
-            elif tag == _HELP_SPRITE_ROW:
-                _, y_off, sprite_list, height = item
-                if item_y + height < content_y or item_y > content_y + content_h:
-                    continue
-                icon_sz = 28
-                gap = 6
-                total_w = len(sprite_list) * (icon_sz + gap) - gap
-                rx = content_x + (content_w - total_w) // 2
-                sprites = self.component_sprites
-                for si, sname in enumerate(sprite_list):
-                    tex = sprites.get(sname) if sprites else None
-                    if tex is None:
-                        continue
-                    ix = rx + si * (icon_sz + gap)
-                    sc = icon_sz / max(1, max(tex.width, tex.height))
-                    dw = tex.width * sc
-                    dh = tex.height * sc
-                    ox = (icon_sz - dw) * 0.5
-                    oy = (icon_sz - dh) * 0.5
-                    draw_texture_pro(
-                        tex,
-                        Rectangle(0, 0, tex.width, tex.height),
-                        Rectangle(ix + ox, int(item_y) + oy, dw, dh),
-                        Vector2(0, 0), 0.0, Color(255, 255, 255, 255),
-                    )
-
-            elif tag == _HELP_DIVIDER:
-                _, y_off = item
-                if item_y + 4 < content_y or item_y > content_y + content_h:
-                    continue
-                draw_rectangle(content_x + 8, int(item_y + 3), content_w - 16, 1, divider_color)
-
-            # _HELP_SPACER: just empty space, nothing to draw
+        # No offscreen target on the web canvas, so instead of caching pixels
+        # replay the previous frame's draw calls while nothing has moved.
+        key = (scroll_y, content_x, content_y, content_w, content_h, self.component_sprites)
+        cached = self._help_draws_cache
+        if cached is None or cached[0] != key:
+            cached = (key, self._help_body_draws(scroll_y, content_x, content_y, content_w, content_h))
+            self._help_draws_cache = cached
+        for draw, args in cached[1]:
+            draw(*args)
 
         end_scissor_mode()
 
@@ -1089,12 +1430,12 @@ class Ui:
             track_x = content_x + content_w - 5
             track_y = content_y + 2
             track_h = content_h - 4
-            draw_rectangle(track_x, track_y, 4, track_h, Color(40, 40, 50, 160))
+            draw_rectangle(track_x, track_y, 4, track_h, _HELP_TRACK_COLOR)
             thumb_ratio = content_h / max(1, total_height)
             thumb_h = max(16, int(track_h * thumb_ratio))
             scroll_ratio = self.help_scroll_y / max(1.0, max_scroll)
             thumb_y = track_y + int((track_h - thumb_h) * scroll_ratio)
-            draw_rectangle(track_x, thumb_y, 4, thumb_h, Color(160, 160, 180, 200))
+            draw_rectangle(track_x, thumb_y, 4, thumb_h, _HELP_THUMB_COLOR)
 
 
 # ── Help panel content types ─────────────────────────────────────────
@@ -1107,6 +1448,40 @@ _HELP_GRID = 5
 _HELP_SPRITE_ROW = 6
 
 
+# Drawn extent below the y offset of fixed-height help items
+_HELP_REACH = {_HELP_HEADER: 20, _HELP_TEXT: 14, _HELP_SPRITE_LINE: 26, _HELP_DIVIDER: 4}
+
+
+@functools.lru_cache(maxsize=8)
+def _help_columns(content_w: int) -> dict[int, tuple[list[float], list[tuple], float]]:
+    """Split the help content by tag into (y offsets, payloads, reach) columns.
+
+    Each column stays sorted by y, so draw_help_panel can bisect every kind's
+    visible range and draw it in one tight loop without per-item dispatch.
+    Payloads are the item tuples minus their tag and y offset; reach is the
+    tallest extent in the column.
+    """
+    items, _total = _build_help_content(content_w)
+    ys: dict[int, list[float]] = {}
+    data: dict[int, list[tuple]] = {}
+    for tag in (_HELP_HEADER, _HELP_TEXT, _HELP_SPRITE_LINE, _HELP_GRID, _HELP_SPRITE_ROW, _HELP_DIVIDER):
+        ys[tag] = []
+        data[tag] = []
+    for item in items:
+        if item[0] in ys:
+            ys[item[0]].append(item[1])
+            data[item[0]].append(item[2:])
+    columns = {}
+    for tag, reach in _HELP_REACH.items():
+        columns[tag] = (ys[tag], data[tag], float(reach))
+    for tag in (_HELP_GRID, _HELP_SPRITE_ROW):
+        columns[tag] = (ys[tag], data[tag], max((d[1] for d in data[tag]), default=0.0))
+    return columns
+
+
+# Pure function of the panel width, which only moves on a layout change.
+# The returned list is shared between calls, so callers must not mutate it.
+@functools.lru_cache(maxsize=8)
 def _build_help_content(content_w: int) -> tuple[list, float]:
     """Build a list of tagged items with pre-computed y-offsets.
 
@@ -1501,6 +1876,8 @@ def _build_help_content(content_w: int) -> tuple[list, float]:
 # ── Upgrade grid position tables (row, col) ──────────────────────────
 # RE: unnamed_function_10402 (lines 385871-386261) — explicit (col, row) coords.
 # Grid spacing in original: 50px horizontal (0x32), 54px vertical (0x36).
+# Read-only: Ui._upgrade_cells resolves each table once and caches the cells
+# by table identity, so the tables must never be edited in place.
 #
 # Page 0 (Main Upgrades):
 #   Row 0: fuel durability (0-5) + fuel power (6-11) = 12 cols
@@ -1509,7 +1886,7 @@ def _build_help_content(content_w: int) -> tuple[list, float]:
 #   Row 3: [25,26,27, _, 23]
 #   Row 4: empty
 #   Row 5: [28,29,30, _, 31]
-_UPGRADE_GRID_POSITIONS: dict[int, tuple[int, int]] = {
+_UPGRADE_GRID_POSITIONS: Mapping[int, tuple[int, int]] = MappingProxyType({
     # Row 0: Fuel durability (cols 0-5) + Fuel power (cols 6-11)
     0: (0, 0), 1: (0, 1), 2: (0, 2), 3: (0, 3), 4: (0, 4), 5: (0, 5),
     6: (0, 6), 7: (0, 7), 8: (0, 8), 9: (0, 9), 10: (0, 10), 11: (0, 11),
@@ -1521,14 +1898,14 @@ _UPGRADE_GRID_POSITIONS: dict[int, tuple[int, int]] = {
     # Row 5: Exchangers group + Reflectors (gap at col 3)
     28: (5, 0), 29: (5, 1), 30: (5, 2), 31: (5, 4),
     # Gate upgrades 32-33 not displayed in main grid
-}
+})
 
 # Page 1 (Prestige Upgrades):
 #   Row 0: [32, _, 34,35,36,37,38,39,43,44,40]
 #   Row 1: [33, 45, _, 50]
 #   Row 2: [46, _, _, 42, 41]
 #   Rows 3-5: [47], [48], [49] in col 0
-_PRESTIGE_GRID_POSITIONS: dict[int, tuple[int, int]] = {
+_PRESTIGE_GRID_POSITIONS: Mapping[int, tuple[int, int]] = MappingProxyType({
     # Row 0: Research Grant + prestige upgrades
     32: (0, 0),   # Research Grant
     34: (0, 2),   # Infused Fuel Cells
@@ -1552,42 +1929,147 @@ _PRESTIGE_GRID_POSITIONS: dict[int, tuple[int, int]] = {
     47: (3, 0),   # Kymium Research
     48: (4, 0),   # Discurrium Research
     49: (5, 0),   # Stavrium Research
-}
+})
 
 
+# Text measurement caches: HUD and panel labels repeat across frames, and the
+# font is fixed once the window is up. Bounded because labels embed numbers.
+# _measure also sees every word-wrap candidate; the help panel alone measures
+# ~800 distinct strings, so it needs room to stay resident beside the HUD.
+@functools.lru_cache(maxsize=4096)
 def _measure(text: str, font_size: int) -> int:
     if measure_text is not None:
         return measure_text(text, font_size)
     return int(len(text) * font_size * 0.6)
 
 
+@functools.lru_cache(maxsize=1024)
 def _fit_font_size(text: str, max_width: int, base_size: int, min_size: int = 8) -> int:
     """Return the largest font size <= base_size that fits text within max_width."""
-    size = base_size
-    while size > min_size:
-        if _measure(text, size) <= max_width:
-            return size
-        size -= 1
-    return min_size
+    if base_size <= min_size:
+        return min_size
+    if _measure(text, base_size) <= max_width:
+        return base_size
+    # Width grows with size, so bisect for the largest fitting size;
+    # min_size is the floor even when nothing fits.
+    lo, hi = min_size, base_size - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if _measure(text, mid) <= max_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+@functools.lru_cache(maxsize=256)
+def _center_offset(text: str, font_size: int, width: int) -> int:
+    """Left offset that centers text in width; for fixed button labels."""
+    return (width - _measure(text, font_size)) // 2
+
+
+# Statistics panel rows: (label, extractor(sim, prestige_ep) or None for static
+# text, format_number_with_suffix kwargs, unit suffix); None is a half-line gap.
+_CAP_FMT = {"max_decimals": 4}
+_STATS_ROWS = (
+    ("Build Version: 1", None, {}, ""),
+    None,
+    ("Current Money: ", lambda sim, ep: sim.store.money, {}, ""),
+    ("Total Money: ", lambda sim, ep: sim.store.total_money, {}, ""),
+    ("Money earned this game: ", lambda sim, ep: sim.store.money_earned_this_game, {}, ""),
+    None,
+    ("Current Power: ", lambda sim, ep: sim.stored_power, {}, ""),
+    ("Total Power produced: ", lambda sim, ep: sim.store.total_power_produced, {}, ""),
+    ("Power produced this game: ", lambda sim, ep: sim.store.power_produced_this_game, {}, ""),
+    None,
+    ("Current Reactor Heat: ", lambda sim, ep: sim.reactor_heat, {}, ""),
+    ("Total Heat dissipated: ", lambda sim, ep: sim.store.total_heat_dissipated, {}, ""),
+    ("Heat dissipated this game: ", lambda sim, ep: sim.store.heat_dissipated_this_game, {}, ""),
+    ("Vent dissipation cap: ", lambda sim, ep: sim.preview_vent_capacity, _CAP_FMT, "/t"),
+    ("Outlet transfer cap: ", lambda sim, ep: sim.preview_outlet_capacity, _CAP_FMT, "/t"),
+    ("Outlet + vent cap: ",
+     lambda sim, ep: sim.preview_vent_capacity + sim.preview_outlet_capacity, _CAP_FMT, "/t"),
+    None,
+    ("Current Exotic Particles: ", lambda sim, ep: sim.store.exotic_particles, {}, ""),
+    ("Total Exotic Particles: ", lambda sim, ep: sim.store.total_exotic_particles, {}, ""),
+    ("Exotic Particles earned from next prestige: ", lambda sim, ep: ep, {}, ""),
+)
+
+
+def _button_texture(
+    base: Optional[Texture2D],
+    hover: Optional[Texture2D],
+    pressed: Optional[Texture2D],
+    is_hover: bool,
+    is_pressed: bool,
+) -> Optional[Texture2D]:
+    """Pick a button's texture: pressed, then hover, falling back to base
+    when the state's texture is missing."""
+    if is_pressed and pressed is not None:
+        return pressed
+    if is_hover and hover is not None:
+        return hover
+    return base
+
+
+def _rect_on_screen(layout: Layout, x: int, y: int, w: int, h: int) -> bool:
+    """True if the rectangle has area and overlaps the window."""
+    return (
+        w > 0 and h > 0
+        and x < layout.window_width and x + w > 0
+        and y < layout.window_height and y + h > 0
+    )
 
 
-def _wrap_text(text: str, max_width: int, font_size: int) -> list[str]:
+# Hovered descriptions, help sprite lines and stats rows are re-wrapped every
+# frame, and wrapping has to measure candidate lines. Results are shared tuples.
+@functools.lru_cache(maxsize=512)
+def _wrap_text(text: str, max_width: int, font_size: int) -> tuple[str, ...]:
     if not text:
-        return []
+        return ()
     words = text.split()
-    lines: list[str] = []
-    current = ""
+    count = len(words)
+    # words[a:b] joined by spaces is offsets[b] - offsets[a] - 1 characters long
+    offsets = [0]
     for word in words:
-        candidate = word if not current else f"{current} {word}"
-        width = _measure(candidate, font_size)
-        if width <= max_width or not current:
-            current = candidate
+        offsets.append(offsets[-1] + len(word) + 1)
+    # Pixels per character, starting from _measure's fallback estimate and
+    # then taken from the last measured line.
+    char_w = font_size * 0.6
+    lines: list[str] = []
+    start = 0
+    while start < count:
+        # Greedy packing takes the longest run of words that fits (at least
+        # one), and widths only grow as words are appended. Guess the run's
+        # end from the character budget, confirm it with one or two
+        # measurements, and bisect only when the guess was off.
+        budget = offsets[start] + 1 + max_width / char_w
+        guess = bisect.bisect_right(offsets, budget, start + 2, count + 1) - 1
+        line = " ".join(words[start:guess])
+        width = _measure(line, font_size)
+        if width > 0:
+            char_w = width / len(line)
+        if width <= max_width:
+            lo, hi = guess, count
+            if guess < count and _measure(" ".join(words[start:guess + 1]), font_size) > max_width:
+                hi = guess
+            else:
+                lo = min(guess + 1, count)
         else:
-            lines.append(current)
-            current = word
-    if current:
-        lines.append(current)
-    return lines
+            lo, hi = start + 1, guess - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if _measure(" ".join(words[start:mid]), font_size) <= max_width:
+                lo = mid
+            else:
+                hi = mid - 1
+        lines.append(" ".join(words[start:lo]))
+        start = lo
+    return tuple(lines)
+
+
+# {N} stat placeholders in component description templates.
+_PLACEHOLDER_RE = re.compile(r"\{(\d+)\}")
 
 
 def _format_component_description(comp: ComponentTypeStats, sim: "Simulation | None" = None) -> str:
@@ -1620,62 +2102,71 @@ def _format_component_description(comp: ComponentTypeStats, sim: "Simulation | N
 
     tid = comp.component_type_id
 
-    # Apply upgrade multipliers if simulation is available
+    # Apply upgrade multipliers if simulation is available. Several
+    # placeholders share a stat, so each bonus is looked up once.
+    bonuses: dict[int, float] = {}
+
     def _m(stat: int) -> float:
         if sim is None:
             return 1.0
-        return sim.upgrade_manager.get_upgrade_stat_bonus(tid, stat)
-
-    dur = comp.max_durability * _m(SC.MAX_DURABILITY)
-    heat_cap = comp.heat_capacity * _m(SC.HEAT_CAPACITY)
-    epp = comp.energy_per_pulse * _m(SC.ENERGY_PER_PULSE)
-    # RE: Protium (type 16) — displayed power includes permanent depletion bonus
-    if tid == 16 and sim is not None:
-        epp *= sim.depleted_protium_count / 100.0 + 1.0
-    hpp = comp.heat_per_pulse * _m(SC.HEAT_PER_PULSE)
+        bonus = bonuses.get(stat)
+        if bonus is None:
+            bonus = sim.upgrade_manager.get_upgrade_stat_bonus(tid, stat)
+            bonuses[stat] = bonus
+        return bonus
+
+    def _epp() -> float:
+        epp = comp.energy_per_pulse * _m(SC.ENERGY_PER_PULSE)
+        # RE: Protium (type 16) — displayed power includes permanent depletion bonus
+        if tid == 16 and sim is not None:
+            epp *= sim.depleted_protium_count / 100.0 + 1.0
+        return epp
+
+    def _hpp() -> float:
+        return comp.heat_per_pulse * _m(SC.HEAT_PER_PULSE)
+
     # Include global multipliers from Active Venting / Active Exchangers
     _svm = sim.self_vent_mult if sim is not None else 1.0
     _hem = sim.heat_exchange_mult if sim is not None else 1.0
-    svr = comp.self_vent_rate * _m(SC.SELF_VENT_RATE) * _svm
-    rvr = comp.reactor_vent_rate * _m(SC.REACTOR_TRANSFER_RATE) * _hem
-    reactor_heat_cap = comp.reactor_heat_capacity_increase * _m(SC.REACTOR_HEAT_CAP_INCREASE)
-    reactor_power_cap = comp.reactor_power_capacity_increase * _m(SC.REACTOR_POWER_CAP_INCREASE)
-
     # Multi-core power/heat formulas (RE: fn_10446 / fn_10444)
     cell_area = max(1, comp.cell_width * comp.cell_height)
-    # {12}/{13}: double cell (cores=4)
-    power_4 = 4 * epp
-    heat_4 = (16 * hpp) / cell_area
-    # {14}/{15}: quad cell (cores=12)
-    power_12 = 12 * epp
-    heat_12 = (144 * hpp) / cell_area
-
-    # {8} = stat 9 (AdjacentTransferRate) × heatExchangeMult — used by exchangers
-    adj_rate = comp.self_vent_rate * _m(SC.ADJACENT_TRANSFER_RATE) * _hem
-    placeholder_map = {
-        "0": format_number_with_suffix(dur),
-        "1": format_number_with_suffix(heat_cap),
-        "2": format_number_with_suffix(epp),
-        "3": format_number_with_suffix(hpp),
-        "4": format_number_with_suffix(comp.pulses_produced),
-        "5": format_number_with_suffix(svr),
-        "7": format_number_with_suffix(comp.self_vent_rate * _m(SC.REACTOR_VENT_RATE)),  # stat=8
-        "8": format_number_with_suffix(adj_rate),
-        "9": format_number_with_suffix(rvr),
-        "10": format_number_with_suffix(reactor_heat_cap),
-        "11": format_number_with_suffix(reactor_power_cap),
-        "12": format_number_with_suffix(power_4),
-        "13": format_number_with_suffix(heat_4),
-        "14": format_number_with_suffix(power_12),
-        "15": format_number_with_suffix(heat_12),
-        "16": f"{int(_m(SC.REFLECTOR_EFFECTIVENESS) - 1.0) + 10}",
+    fmt = format_number_with_suffix
+
+    # Templates reference only a few placeholders, so each value is computed
+    # and formatted when _replace first meets it rather than all up front.
+    placeholder_values = {
+        "0": lambda: fmt(comp.max_durability * _m(SC.MAX_DURABILITY)),
+        "1": lambda: fmt(comp.heat_capacity * _m(SC.HEAT_CAPACITY)),
+        "2": lambda: fmt(_epp()),
+        "3": lambda: fmt(_hpp()),
+        "4": lambda: fmt(comp.pulses_produced),
+        "5": lambda: fmt(comp.self_vent_rate * _m(SC.SELF_VENT_RATE) * _svm),
+        "7": lambda: fmt(comp.self_vent_rate * _m(SC.REACTOR_VENT_RATE)),  # stat=8
+        # {8} = stat 9 (AdjacentTransferRate) × heatExchangeMult — used by exchangers
+        "8": lambda: fmt(comp.self_vent_rate * _m(SC.ADJACENT_TRANSFER_RATE) * _hem),
+        "9": lambda: fmt(comp.reactor_vent_rate * _m(SC.REACTOR_TRANSFER_RATE) * _hem),
+        "10": lambda: fmt(comp.reactor_heat_capacity_increase * _m(SC.REACTOR_HEAT_CAP_INCREASE)),
+        "11": lambda: fmt(comp.reactor_power_capacity_increase * _m(SC.REACTOR_POWER_CAP_INCREASE)),
+        # {12}/{13}: double cell (cores=4)
+        "12": lambda: fmt(4 * _epp()),
+        "13": lambda: fmt((16 * _hpp()) / cell_area),
+        # {14}/{15}: quad cell (cores=12)
+        "14": lambda: fmt(12 * _epp()),
+        "15": lambda: fmt((144 * _hpp()) / cell_area),
+        "16": lambda: f"{int(_m(SC.REFLECTOR_EFFECTIVENESS) - 1.0) + 10}",
     }
+    resolved: dict[str, str] = {}
 
     def _replace(match: re.Match[str]) -> str:
         key = match.group(1)
-        return placeholder_map.get(key, "?")
+        text = resolved.get(key)
+        if text is None:
+            compute = placeholder_values.get(key)
+            text = compute() if compute is not None else "?"
+            resolved[key] = text
+        return text
 
-    return re.sub(r"\{(\d+)\}", _replace, description)
+    return _PLACEHOLDER_RE.sub(_replace, description)
 
 
 def _format_cost_line(comp: ComponentTypeStats, effective_cost: float | None = None) -> str:
@@ -1698,65 +2189,72 @@ def _format_sell_line(placed: ReactorComponent) -> str:
 
 
 
+# Derived from FormatNumberWithSuffix in the decompiled WebGL build.
+_NUMBER_SUFFIXES = (
+    "",
+    "K",
+    "M",
+    "B",
+    "T",
+    "Qa",
+    "Qi",
+    "Sx",
+    "Sp",
+    "O",
+    "N",
+    "U",
+    "D",
+    "DD",
+    "TD",
+    "QuD",
+    "QaD",
+    "SxD",
+    "SpD",
+    "OD",
+    "ND",
+    "V",
+)
+
+
+# Divisor for each suffix group, so a cache miss does no integer power.
+_NUMBER_SCALES = tuple(10 ** (group * 3) for group in range(len(_NUMBER_SUFFIXES)))
+_NUMBER_TOP_GROUP = len(_NUMBER_SUFFIXES) - 1
+# Fixed-point format specs by decimal count (0-4), so no spec is built per call
+_DECIMAL_SPECS = tuple(f".{decimals}f" for decimals in range(5))
+
+
+# Labels are re-rendered every frame from values that change at most once per
+# tick, so most calls repeat an earlier (value, decimals) key exactly. Sized so
+# the per-tick HUD/statistics churn doesn't evict the stable component stats
+# that tooltips and the reactor description keep asking for. Keys compare by
+# value, so 1 and 1.0 (or 0.0 and -0.0) share an entry; they format the same.
+@functools.lru_cache(maxsize=2048)
 def format_number_with_suffix(value: float, max_decimals: int = 3, min_decimals: int = 0) -> str:
-    zero = "0." + "0" * min_decimals if min_decimals > 0 else "0"
-    if not math.isfinite(value):
-        return zero
-    if value == 0.0:
-        return zero
-
-    # Derived from FormatNumberWithSuffix in the decompiled WebGL build.
-    suffixes = [
-        "",
-        "K",
-        "M",
-        "B",
-        "T",
-        "Qa",
-        "Qi",
-        "Sx",
-        "Sp",
-        "O",
-        "N",
-        "U",
-        "D",
-        "DD",
-        "TD",
-        "QuD",
-        "QaD",
-        "SxD",
-        "SpD",
-        "OD",
-        "ND",
-        "V",
-    ]
-    abs_val = abs(value)
-    if abs_val == 0.0:
-        return "0"
+    if value == 0.0 or not math.isfinite(value):
+        return "0." + "0" * min_decimals if min_decimals > 0 else "0"
 
+    abs_val = abs(value)
     if abs_val < 1000.0:
         group = 0
     else:
-        exp = int(math.floor(math.log10(abs_val)))
-        group = max(0, int(exp / 3))
-
-    group = min(group, len(suffixes) - 1)
-    scale = 10 ** (group * 3)
-    scaled = value / scale
-    if group < len(suffixes) - 1 and abs(scaled) >= 999.5:
+        # Largest scale <= abs_val, found by comparison instead of log10;
+        # values past the last suffix stay in the top group.
+        group = bisect.bisect_right(_NUMBER_SCALES, abs_val) - 1
+    scaled = value / _NUMBER_SCALES[group]
+    if group < _NUMBER_TOP_GROUP and abs(scaled) >= 999.5:
         group += 1
-        scale *= 1000
-        scaled = value / scale
+        scaled = value / _NUMBER_SCALES[group]
     decimals = max(0, min(4, max_decimals))
 
-    out = f"{scaled:.{decimals}f}"
+    out = format(scaled, _DECIMAL_SPECS[decimals])
     if "." in out:
         out = out.rstrip("0").rstrip(".")
     if min_decimals > 0:
-        if "." not in out:
+        dot = out.find(".")
+        if dot < 0:
             out += "." + "0" * min_decimals
         else:
-            current = len(out.split(".")[1])
+            current = len(out) - dot - 1
             if current < min_decimals:
                 out += "0" * (min_decimals - current)
-    return f"{out}{suffixes[group]}"
+    return out + _NUMBER_SUFFIXES[group]
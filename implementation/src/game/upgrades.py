@@ -10,7 +10,7 @@ import json
 from dataclasses import dataclass, field
 from enum import IntEnum
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 class StatCategory(IntEnum):
@@ -103,10 +103,21 @@ class UpgradeManager:
               additive_sum += bonus.additive * upgrade.level
               multiplicative_product *= bonus.multiplicative ** upgrade.level
       return multiplicative_product * (additive_sum + 1.0)
+
+    Bonuses are memoized per (component_type, stat_category). Code that sets
+    UpgradeType.level directly must call invalidate() afterwards; version
+    lets callers key their own caches on the current upgrade state.
     """
 
     def __init__(self) -> None:
         self.upgrades: List[UpgradeType] = []
+        self.version: int = 0
+        self._bonus_cache: Dict[Tuple[int, int], float] = {}
+
+    def invalidate(self) -> None:
+        """Drop memoized bonuses after upgrade levels change."""
+        self.version += 1
+        self._bonus_cache.clear()
 
     def load(self, path: Optional[Path] = None) -> None:
         if path is None:
@@ -140,6 +151,7 @@ class UpgradeManager:
                 category=entry.get("category", ""),
                 level=0,
             ))
+        self.invalidate()
 
     def get_upgrade_stat_bonus(self, component_type: int, stat_category: int) -> float:
         """RE: unnamed_function_10371 — compute cumulative bonus for a stat.
@@ -147,6 +159,10 @@ class UpgradeManager:
         Returns multiplicative_product * (additive_sum + 1.0).
         With no upgrades purchased, returns 1.0.
         """
+        key = (component_type, stat_category)
+        cached = self._bonus_cache.get(key)
+        if cached is not None:
+            return cached
         additive_sum = 0.0
         multiplicative_product = 1.0
         for upgrade in self.upgrades:
@@ -156,7 +172,9 @@ class UpgradeManager:
                 if bonus.component_type == component_type and bonus.stat_category == stat_category:
                     additive_sum += bonus.additive * upgrade.level
                     multiplicative_product *= bonus.multiplicative ** upgrade.level
-        return multiplicative_product * (additive_sum + 1.0)
+        result = multiplicative_product * (additive_sum + 1.0)
+        self._bonus_cache[key] = result
+        return result
 
     def get_cost(self, upgrade_idx: int, level: Optional[int] = None) -> float:
         """Compute cost for purchasing the next level of an upgrade.
@@ -204,6 +222,7 @@ class UpgradeManager:
         else:
             money -= cost
         u.level += 1
+        self.invalidate()
         return money, exotic_particles
 
     def get_upgrade_discount(self) -> float:
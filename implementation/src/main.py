@@ -33,7 +33,6 @@ from raylib_compat import (
     is_mouse_button_down,
     is_mouse_button_pressed,
     load_texture,
-    measure_text,
     MOUSE_BUTTON_LEFT,
     MOUSE_BUTTON_MIDDLE,
     MOUSE_BUTTON_RIGHT,
@@ -43,10 +42,10 @@ from raylib_compat import (
     KEY_SPACE,
     KEY_ESCAPE,
     Rectangle,
-    Vector2,
     set_exit_key,
     set_target_fps,
     get_pending_file_import,
+    texture_source_rect,
 )
 
 if not _WEB:
@@ -69,11 +68,25 @@ if not _WEB:
 from game.layout import load_layout
 from game.grid import Grid
 from game.simulation import ReactorComponent, ExplosionEffect, demo_simulation
-from game.ui import Ui
+from game.ui import Ui, _ORIGIN, _WHITE, _fit_font_size, _measure
 
 # Global reference for beforeunload auto-save from JS
 _sim_ref = None
 
+# Frame colors, built once rather than per draw call
+_CLEAR_COLOR = Color(18, 18, 22, 255)
+_TEXT_COLOR = Color(230, 230, 230, 255)
+_GRID_TINT = Color(255, 255, 255, 120)
+_DEPLETED_TINT = Color(180, 180, 180, 255)
+_HEAT_BAR_BG = Color(40, 10, 10, 180)
+_DURABILITY_BAR_BG = Color(10, 30, 10, 180)
+_REFERENCE_TINT = Color(255, 255, 255, 160)
+_REFERENCE_LABEL_COLOR = Color(200, 200, 200, 255)
+
+# Store icon tints
+_STORE_TINT_SELECTED = Color(120, 255, 120, 255)  # green tint for selected + affordable
+_STORE_TINT_UNAFFORDABLE = Color(160, 160, 160, 255)  # dim for unaffordable
+
 
 def _load_texture(name: str) -> Texture2D:
     return load_texture(str(sprite_path(name)))
@@ -186,6 +199,10 @@ async def main() -> None:
         except Exception:
             continue
 
+    # (sprite name, cell size) -> (draw w, draw h, x offset, y offset) for
+    # placed components; depends only on the texture and the grid zoom.
+    cell_sprite_fits: dict[tuple[str, int], tuple[float, float, float, float]] = {}
+
     # Load upgrade icon sprites: map upgrade icon/category paths to component sprites
     _UPGRADE_ICON_MAP = {
         "UI/Upgrade Icons/Fuel1": "Fuel1-1.png",
@@ -267,6 +284,7 @@ async def main() -> None:
         upgrade_sprites=upgrade_sprites,
     )
     ui.component_sprites = component_sprites
+    ui.prepare_help(layout)
 
     if _WEB:
         ui.save_dir = True  # Signals web mode for export/import buttons
@@ -538,34 +556,34 @@ async def main() -> None:
             sim.refresh_live_preview()
 
             begin_drawing()
-            clear_background(Color(18, 18, 22, 255))
+            clear_background(_CLEAR_COLOR)
 
             if show_reference and reference_textures:
                 ref_tex, ref_name = reference_textures[reference_index]
-                src = Rectangle(0, 0, ref_tex.width, ref_tex.height)
+                src = texture_source_rect(ref_tex)
                 dst = Rectangle(0, 0, layout.window_width, layout.window_height)
-                origin = Vector2(0, 0)
-                draw_texture_pro(ref_tex, src, dst, origin, 0.0, Color(255, 255, 255, 160))
+                origin = _ORIGIN
+                draw_texture_pro(ref_tex, src, dst, origin, 0.0, _REFERENCE_TINT)
                 draw_text(
                     f"Reference: {ref_name}",
                     16,
                     layout.window_height - 20,
                     12,
-                    Color(200, 200, 200, 255),
+                    _REFERENCE_LABEL_COLOR,
                 )
 
             draw_texture_pro(
                 side_grid,
-                Rectangle(0, 0, side_grid.width, side_grid.height),
+                texture_source_rect(side_grid),
                 Rectangle(
                     layout.left_panel_x,
                     layout.left_panel_y,
                     layout.left_panel_w,
                     layout.left_panel_h,
                 ),
-                Vector2(0, 0),
+                _ORIGIN,
                 0.0,
-                Color(255, 255, 255, 255),
+                _WHITE,
             )
 
             frame_x = layout.grid_frame_x
@@ -575,16 +593,16 @@ async def main() -> None:
 
             draw_texture_pro(
                 grid_backer,
-                Rectangle(0, 0, grid_backer.width, grid_backer.height),
+                texture_source_rect(grid_backer),
                 Rectangle(backer_x, backer_y, grid_backer.width, grid_backer.height),
-                Vector2(0, 0),
+                _ORIGIN,
                 0.0,
-                Color(255, 255, 255, 255),
+                _WHITE,
             )
 
             if sim.view_mode == "reactor":
                 # ── Reactor grid view ──────────────────────────────────
-                grid.draw(Color(255, 255, 255, 120))
+                grid.draw(_GRID_TINT)
 
                 use_scissor = sim.grid is not None and sim.grid.needs_scroll
 
@@ -600,29 +618,31 @@ async def main() -> None:
                     bar_margin = 2
                     bar_w = cell_sz - bar_margin * 2
 
-                    for gx, gy, _gz, component in sim.grid.iter_cells():
-                        if component is None:
-                            continue
-                        tex = component_sprites.get(component.stats.sprite_name)
+                    for gx, gy, _gz, component in sim.grid.iter_occupied():
+                        sprite_name = component.stats.sprite_name
+                        tex = component_sprites.get(sprite_name)
                         if tex is None:
                             continue
                         px, py = sim.grid.cell_to_screen(gx, gy)
-                        scale = min(1.0, cell_sz / max(1, tex.width), cell_sz / max(1, tex.height))
-                        draw_w = tex.width * scale
-                        draw_h = tex.height * scale
-                        offset_x = (cell_sz - draw_w) * 0.5
-                        offset_y = (cell_sz - draw_h) * 0.5
+                        fit = cell_sprite_fits.get((sprite_name, cell_sz))
+                        if fit is None:
+                            scale = min(1.0, cell_sz / max(1, tex.width), cell_sz / max(1, tex.height))
+                            draw_w = tex.width * scale
+                            draw_h = tex.height * scale
+                            fit = (draw_w, draw_h, (cell_sz - draw_w) * 0.5, (cell_sz - draw_h) * 0.5)
+                            cell_sprite_fits[(sprite_name, cell_sz)] = fit
+                        draw_w, draw_h, offset_x, offset_y = fit
 
                         if component.depleted:
-                            tint = Color(180, 180, 180, 255)
+                            tint = _DEPLETED_TINT
                         else:
-                            tint = Color(255, 255, 255, 255)
+                            tint = _WHITE
 
                         draw_texture_pro(
                             tex,
-                            Rectangle(0, 0, tex.width, tex.height),
+                            texture_source_rect(tex),
                             Rectangle(px + offset_x, py + offset_y, draw_w, draw_h),
-                            Vector2(0, 0),
+                            _ORIGIN,
                             0.0,
                             tint,
                         )
@@ -656,7 +676,7 @@ async def main() -> None:
                                 draw_rectangle(
                                     int(px + bar_margin), int(bar_y),
                                     int(bar_w), int(bar_h),
-                                    Color(40, 10, 10, 180),
+                                    _HEAT_BAR_BG,
                                 )
                             if fill > 0.001:
                                 if raw_fill > 0.8:
@@ -682,7 +702,7 @@ async def main() -> None:
                             draw_rectangle(
                                 int(px + bar_margin), int(bar_y),
                                 int(bar_w), int(bar_h),
-                                Color(10, 30, 10, 180),
+                                _DURABILITY_BAR_BG,
                             )
                             if fill > 0.001:
                                 if fill > 0.5:
@@ -712,11 +732,11 @@ async def main() -> None:
                             ex_sx, ex_sy = sim.grid.cell_to_screen(effect.grid_x, effect.grid_y)
                             draw_texture_pro(
                                 ex_tex,
-                                Rectangle(0, 0, ex_tex.width, ex_tex.height),
+                                texture_source_rect(ex_tex),
                                 Rectangle(ex_sx + ex_ox, ex_sy + ex_oy, ex_w, ex_h),
-                                Vector2(0, 0),
+                                _ORIGIN,
                                 0.0,
-                                Color(255, 255, 255, 255),
+                                _WHITE,
                             )
 
                 if use_scissor:
@@ -740,11 +760,11 @@ async def main() -> None:
 
             draw_texture_pro(
                 grid_frame,
-                Rectangle(0, 0, grid_frame.width, grid_frame.height),
+                texture_source_rect(grid_frame),
                 Rectangle(frame_x, frame_y, grid_frame.width, grid_frame.height),
-                Vector2(0, 0),
+                _ORIGIN,
                 0.0,
-                Color(255, 255, 255, 255),
+                _WHITE,
             )
 
             # Scrollbars drawn on top of grid frame so they're visible
@@ -752,34 +772,31 @@ async def main() -> None:
                 sim.grid.draw_scrollbars()
 
             def draw_button_label(label: str, x: int, y: int, w: int, h: int, base_size: int, min_size: int = 8) -> None:
-                fs = base_size
-                max_w = max(8, w - 10)
-                while fs > min_size and measure_text(label, fs) > max_w:
-                    fs -= 1
-                tw = measure_text(label, fs)
+                fs = _fit_font_size(label, max(8, w - 10), base_size, min_size)
+                tw = _measure(label, fs)
                 tx = x + max(0, (w - tw) // 2)
                 ty = y + max(0, (h - fs) // 2) - 1
-                draw_text(label, tx, ty, fs, Color(230, 230, 230, 255))
+                draw_text(label, tx, ty, fs, _TEXT_COLOR)
 
             # Top-left upgrade tabs
             upg_tex = btn_med_pressed if sim.view_mode == "upgrades" else (btn_med_hover if hover_upgrades else btn_med)
             draw_texture_pro(
                 upg_tex,
-                Rectangle(0, 0, upg_tex.width, upg_tex.height),
+                texture_source_rect(upg_tex),
                 Rectangle(layout.main_upgrades_x, layout.main_upgrades_y, upg_tex.width, upg_tex.height),
-                Vector2(0, 0),
+                _ORIGIN,
                 0.0,
-                Color(255, 255, 255, 255),
+                _WHITE,
             )
             draw_button_label("Upgrades", layout.main_upgrades_x, layout.main_upgrades_y, upg_tex.width, upg_tex.height, 13, 10)
             prs_tex = btn_med_pressed if sim.view_mode == "prestige" else (btn_med_hover if hover_prestige else btn_med)
             draw_texture_pro(
                 prs_tex,
-                Rectangle(0, 0, prs_tex.width, prs_tex.height),
+                texture_source_rect(prs_tex),
                 Rectangle(layout.prestige_upgrades_x, layout.prestige_upgrades_y, prs_tex.width, prs_tex.height),
-                Vector2(0, 0),
+                _ORIGIN,
                 0.0,
-                Color(255, 255, 255, 255),
+                _WHITE,
             )
             draw_button_label("Prestige", layout.prestige_upgrades_x, layout.prestige_upgrades_y, prs_tex.width, prs_tex.height, 13, 10)
 
@@ -787,31 +804,31 @@ async def main() -> None:
             opt_tex = btn_small_pressed if sim.view_mode == "options" else (btn_small_hover if hover_options else btn_small)
             draw_texture_pro(
                 opt_tex,
-                Rectangle(0, 0, opt_tex.width, opt_tex.height),
+                texture_source_rect(opt_tex),
                 Rectangle(layout.options_x, layout.options_y, opt_tex.width, opt_tex.height),
-                Vector2(0, 0),
+                _ORIGIN,
                 0.0,
-                Color(255, 255, 255, 255),
+                _WHITE,
             )
             draw_button_label("Options", layout.options_x, layout.options_y, opt_tex.width, opt_tex.height, 10, 8)
             stats_tex = btn_small_pressed if sim.view_mode == "statistics" else (btn_small_hover if hover_stats else btn_small)
             draw_texture_pro(
                 stats_tex,
-                Rectangle(0, 0, stats_tex.width, stats_tex.height),
+                texture_source_rect(stats_tex),
                 Rectangle(layout.stats_x_btn, layout.stats_y_btn, stats_tex.width, stats_tex.height),
-                Vector2(0, 0),
+                _ORIGIN,
                 0.0,
-                Color(255, 255, 255, 255),
+                _WHITE,
             )
             draw_button_label("Statistics", layout.stats_x_btn, layout.stats_y_btn, stats_tex.width, stats_tex.height, 10, 8)
             help_tex = btn_small_pressed if sim.view_mode == "help" else (btn_small_hover if hover_help else btn_small)
             draw_texture_pro(
                 help_tex,
-                Rectangle(0, 0, help_tex.width, help_tex.height),
+                texture_source_rect(help_tex),
                 Rectangle(layout.help_x, layout.help_y, help_tex.width, help_tex.height),
-                Vector2(0, 0),
+                _ORIGIN,
                 0.0,
-                Color(255, 255, 255, 255),
+                _WHITE,
             )
             draw_button_label("Help", layout.help_x, layout.help_y, help_tex.width, help_tex.height, 10, 8)
 
@@ -820,15 +837,15 @@ async def main() -> None:
                 back_tex = btn_back_pressed if (hover_back and is_mouse_button_down(MOUSE_BUTTON_LEFT)) else (btn_back_hover if hover_back else btn_back)
                 draw_texture_pro(
                     back_tex,
-                    Rectangle(0, 0, back_tex.width, back_tex.height),
+                    texture_source_rect(back_tex),
                     Rectangle(layout.back_x, layout.back_y, back_tex.width, back_tex.height),
-                    Vector2(0, 0),
+                    _ORIGIN,
                     0.0,
-                    Color(255, 255, 255, 255),
+                    _WHITE,
                 )
                 # ButtonBACK is 96x46; arrow takes ~28px on left, center text in remaining area
-                back_text_x = layout.back_x + 28 + (96 - 28 - measure_text("Back", 14)) // 2
-                draw_text("Back", back_text_x, layout.back_y + 16, 14, Color(230, 230, 230, 255))
+                back_text_x = layout.back_x + 28 + (96 - 28 - _measure("Back", 14)) // 2
+                draw_text("Back", back_text_x, layout.back_y + 16, 14, _TEXT_COLOR)
 
             # Grid hover (fallback — shop hover in ui.draw() will override)
             sim.hover_component = None
@@ -857,6 +874,10 @@ async def main() -> None:
             # Store icon overlay (draw after slots so icons sit on top)
             shop_components = sim.shop_components_for_page()
             slots = ui.store_item_slots(layout, shop_components)
+            # Per-frame inputs are the same for every icon; read them once.
+            money = sim.store.money
+            selected_index = sim.selected_component_index
+            discount = sim.upgrade_manager.get_component_discount()
             for _idx, (comp, rect) in enumerate(slots):
                 tex = component_sprites.get(comp.sprite_name)
                 if tex is None:
@@ -866,18 +887,18 @@ async def main() -> None:
                 draw_h = tex.height
                 icon_x = x + (w - draw_w) / 2
                 icon_y = y + (h - draw_h) / 2
-                eff_cost = sim.get_component_cost(comp)
-                if _idx == sim.selected_component_index and sim.store.money >= eff_cost:
-                    tint = Color(120, 255, 120, 255)  # green tint for selected + affordable
-                elif eff_cost > 0.0 and sim.store.money < eff_cost:
-                    tint = Color(160, 160, 160, 255)  # dim for unaffordable
+                eff_cost = comp.cost * discount  # sim.get_component_cost
+                if _idx == selected_index and money >= eff_cost:
+                    tint = _STORE_TINT_SELECTED
+                elif eff_cost > 0.0 and money < eff_cost:
+                    tint = _STORE_TINT_UNAFFORDABLE
                 else:
-                    tint = Color(255, 255, 255, 255)
+                    tint = _WHITE
                 draw_texture_pro(
                     tex,
-                    Rectangle(0, 0, tex.width, tex.height),
+                    texture_source_rect(tex),
                     Rectangle(icon_x, icon_y, draw_w, draw_h),
-                    Vector2(0, 0),
+                    _ORIGIN,
                     0.0,
                     tint,
                 )
@@ -901,11 +922,11 @@ async def main() -> None:
                     pause_tex = btn_play
             draw_texture_pro(
                 pause_tex,
-                Rectangle(0, 0, pause_tex.width, pause_tex.height),
+                texture_source_rect(pause_tex),
                 Rectangle(layout.pause_x, layout.pause_y, pause_tex.width, pause_tex.height),
-                Vector2(0, 0),
+                _ORIGIN,
                 0.0,
-                Color(255, 255, 255, 255),
+                _WHITE,
             )
 
             # Replace/NoReplace: REPLACE sprites when on, NOREPLACE when off
@@ -925,11 +946,11 @@ async def main() -> None:
                     replace_tex = btn_noreplace
             draw_texture_pro(
                 replace_tex,
-                Rectangle(0, 0, replace_tex.width, replace_tex.height),
+                texture_source_rect(replace_tex),
                 Rectangle(layout.replace_x, layout.replace_y, replace_tex.width, replace_tex.height),
-                Vector2(0, 0),
+                _ORIGIN,
                 0.0,
-                Color(255, 255, 255, 255),
+                _WHITE,
             )
 
             end_drawing()
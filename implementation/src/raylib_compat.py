@@ -83,6 +83,17 @@ if not _WEB:
     if "MOUSE_BUTTON_MIDDLE" not in globals():
         MOUSE_BUTTON_MIDDLE = 2  # type: ignore
 
+    def draw_rectangle_bordered(x, y, width, height, fill, border):  # type: ignore
+        """Filled rectangle with a 1px outline in a second color."""
+        draw_rectangle(x, y, width, height, fill)
+        draw_rectangle_lines(x, y, width, height, border)
+
+    def draw_texture_batch(quads, tint):  # type: ignore
+        """Draw unrotated (texture, source, dest) quads sharing one tint."""
+        origin = Vector2(0, 0)
+        for texture, src_rect, dst_rect in quads:
+            draw_texture_pro(texture, src_rect, dst_rect, origin, 0.0, tint)
+
     def _encode_text(value):  # type: ignore
         if isinstance(value, str):
             return value.encode("utf-8")
@@ -101,6 +112,11 @@ if not _WEB:
             return _draw_text(_encode_text(text), x, y, size, color)
         globals()["draw_text"] = draw_text
 
+        def draw_text_batch(items, color):  # type: ignore
+            """Draw (text, x, y, size) entries sharing one color."""
+            for text, x, y, size in items:
+                _draw_text(_encode_text(text), x, y, size, color)
+
     if "measure_text" in globals():
         _measure_text = globals()["measure_text"]
         def measure_text(text, size):  # type: ignore
@@ -285,6 +301,18 @@ else:
         _cmds.extend((OP_STROKE_RECT, float(x), float(y), float(width), float(height),
                        color[0], color[1], color[2], color[3]))
 
+    def draw_rectangle_bordered(x: int, y: int, width: int, height: int,
+                                fill: tuple, border: tuple) -> None:
+        """Queue a filled rectangle and its outline with one buffer extend."""
+        x = float(x)
+        y = float(y)
+        width = float(width)
+        height = float(height)
+        _cmds.extend((OP_FILL_RECT, x, y, width, height,
+                       fill[0], fill[1], fill[2], fill[3],
+                       OP_STROKE_RECT, x, y, width, height,
+                       border[0], border[1], border[2], border[3]))
+
     # ── Text ─────────────────────────────────────────────────────────
 
     def draw_text(text: str, x: int, y: int, size: int, color: tuple) -> None:
@@ -293,6 +321,17 @@ else:
         _cmds.extend((OP_DRAW_TEXT, float(str_idx), float(x), float(y), float(size),
                        color[0], color[1], color[2], color[3]))
 
+    def draw_text_batch(items, color: tuple) -> None:
+        """Queue (text, x, y, size) entries sharing one color with one buffer extend."""
+        r, g, b, a = color
+        str_idx = len(_strings)
+        cmds: list = []
+        for text, x, y, size in items:
+            _strings.append(str(text))
+            cmds += (OP_DRAW_TEXT, float(str_idx), float(x), float(y), float(size), r, g, b, a)
+            str_idx += 1
+        _cmds.extend(cmds)
+
     _measure_cache: dict[tuple, int] = {}
 
     def measure_text(text: str, size: int) -> int:
@@ -345,6 +384,19 @@ else:
                        float(dst_rect[2]), float(dst_rect[3]),
                        tint[0], tint[1], tint[2], tint[3]))
 
+    def draw_texture_batch(quads, tint: tuple) -> None:
+        """Queue unrotated (texture, source, dest) quads sharing one tint with one buffer extend."""
+        r, g, b, a = tint
+        cmds: list = []
+        for texture, src_rect, dst_rect in quads:
+            cmds += (OP_TEXTURE_PRO, float(texture.id),
+                     float(src_rect[0]), float(src_rect[1]),
+                     float(src_rect[2]), float(src_rect[3]),
+                     float(dst_rect[0]), float(dst_rect[1]),
+                     float(dst_rect[2]), float(dst_rect[3]),
+                     r, g, b, a)
+        _cmds.extend(cmds)
+
     def draw_texture_ex(texture, position: tuple, rotation: float,
                         scale: float, tint: tuple) -> None:
         _cmds.extend((OP_TEXTURE_EX, float(texture.id),
@@ -393,3 +445,21 @@ else:
             return None
         val = _input_state['fileImport']
         return str(val) if val is not None else None
+
+
+# ══════════════════════════════════════════════════════════════════════
+# Shared helpers
+# ══════════════════════════════════════════════════════════════════════
+
+# id(texture) -> (texture, full source rectangle); the texture is kept so
+# a recycled id can't hand back another texture's rectangle.
+_source_rects: dict[int, tuple] = {}
+
+
+def texture_source_rect(texture):
+    """Rectangle covering the whole texture, built once per texture."""
+    entry = _source_rects.get(id(texture))
+    if entry is None or entry[0] is not texture:
+        entry = (texture, Rectangle(0, 0, texture.width, texture.height))
+        _source_rects[id(texture)] = entry
+    return entry[1]